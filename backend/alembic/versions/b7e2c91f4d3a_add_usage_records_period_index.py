@@ -0,0 +1,40 @@
+"""add_usage_records_period_index
+
+Revision ID: b7e2c91f4d3a
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c91f4d3a"
+down_revision: str | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # (tenant_id, resource_type) is a prefix of the new index, so replace it
+    op.create_index(
+        "ix_usage_records_tenant_resource_recorded",
+        "usage_records",
+        ["tenant_id", "resource_type", "recorded_at"],
+        unique=False,
+    )
+    op.drop_index("ix_usage_records_tenant_resource", table_name="usage_records")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_usage_records_tenant_resource",
+        "usage_records",
+        ["tenant_id", "resource_type"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_usage_records_tenant_resource_recorded", table_name="usage_records"
+    )
@@ -0,0 +1,38 @@
+"""add_subscriptions_tenant_status_index
+
+Revision ID: c3f8a2d6e1b9
+Revises: b7e2c91f4d3a
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a2d6e1b9"
+down_revision: str | None = "b7e2c91f4d3a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # (tenant_id) is a prefix of the new index, so replace it
+    op.create_index(
+        "ix_subscriptions_tenant_status",
+        "subscriptions",
+        ["tenant_id", "status"],
+        unique=False,
+    )
+    op.drop_index("ix_subscriptions_tenant_id", table_name="subscriptions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_subscriptions_tenant_id",
+        "subscriptions",
+        ["tenant_id"],
+        unique=False,
+    )
+    op.drop_index("ix_subscriptions_tenant_status", table_name="subscriptions")
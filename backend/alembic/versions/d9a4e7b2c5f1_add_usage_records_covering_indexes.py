@@ -0,0 +1,61 @@
+"""add_usage_records_covering_indexes
+
+Revision ID: d9a4e7b2c5f1
+Revises: c3f8a2d6e1b9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a4e7b2c5f1"
+down_revision: str | None = "c3f8a2d6e1b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # (tenant_id) is a prefix of the new period index, so replace it
+    op.create_index(
+        "ix_usage_records_tenant_recorded",
+        "usage_records",
+        ["tenant_id", "recorded_at"],
+        unique=False,
+        postgresql_include=["resource_type", "quantity"],
+    )
+    op.drop_index("ix_usage_records_tenant_id", table_name="usage_records")
+
+    # Rebuild the summary index with quantity as a covering column
+    op.drop_index(
+        "ix_usage_records_tenant_resource_recorded", table_name="usage_records"
+    )
+    op.create_index(
+        "ix_usage_records_tenant_resource_recorded",
+        "usage_records",
+        ["tenant_id", "resource_type", "recorded_at"],
+        unique=False,
+        postgresql_include=["quantity"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_usage_records_tenant_resource_recorded", table_name="usage_records"
+    )
+    op.create_index(
+        "ix_usage_records_tenant_resource_recorded",
+        "usage_records",
+        ["tenant_id", "resource_type", "recorded_at"],
+        unique=False,
+    )
+
+    op.create_index(
+        "ix_usage_records_tenant_id",
+        "usage_records",
+        ["tenant_id"],
+        unique=False,
+    )
+    op.drop_index("ix_usage_records_tenant_recorded", table_name="usage_records")
@@ -7,7 +7,7 @@ and repositories.  Contains no business rules itself.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
 from billing.domain.entities import Subscription, UsageRecord
 from billing.domain.factories import SubscriptionFactory
@@ -123,7 +123,7 @@ class BillingApplicationService:
             tenant_id=tenant_id,
             resource_type="optimization",
             quantity=1,
-            recorded_at=datetime.utcnow(),
+            recorded_at=datetime.now(UTC).replace(tzinfo=None),
         )
         await self._usage_repo.save(record)
         await self._uow.commit()
@@ -9,16 +9,21 @@ This module contains:
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
-from billing.domain.value_objects import Plan
+from billing.domain.value_objects import Plan, SubscriptionStatus
 from shared.domain.aggregate_root import AggregateRoot
 from shared.domain.base_entity import BaseEntity
 from shared.domain.domain_event import DomainEvent
 from shared.domain.exceptions import ValidationError
 
-# Valid subscription statuses
-_VALID_STATUSES = {"active", "cancelled", "expired"}
+# Transition matrix: bit `s` of _ALLOWED_SOURCES[target] is set when
+# moving from status `s` to `target` is permitted.
+_ALLOWED_SOURCES: tuple[int, ...] = (
+    0,  # ACTIVE — never re-entered
+    1 << SubscriptionStatus.ACTIVE,  # CANCELLED
+    1 << SubscriptionStatus.ACTIVE,  # EXPIRED
+)
 
 
 class Subscription(AggregateRoot):
@@ -30,7 +35,7 @@ class Subscription(AggregateRoot):
     Args:
         tenant_id: UUID of the owning tenant.
         plan: The subscription plan tier.
-        status: Current status (active, cancelled, expired).
+        status: Current status, as a SubscriptionStatus or its label.
         current_period_start: Start of the current billing period.
         current_period_end: End of the current billing period.
         stripe_subscription_id: Optional external Stripe subscription ID.
@@ -39,24 +44,30 @@ class Subscription(AggregateRoot):
         ValidationError: If the initial status is not valid.
     """
 
+    __slots__ = (
+        "tenant_id",
+        "plan",
+        "status",
+        "current_period_start",
+        "current_period_end",
+        "stripe_subscription_id",
+    )
+
     def __init__(
         self,
         tenant_id: uuid.UUID,
         plan: Plan,
-        status: str,
+        status: SubscriptionStatus | str,
         current_period_start: datetime,
         current_period_end: datetime,
         stripe_subscription_id: str | None = None,
     ) -> None:
         super().__init__()
-        if status not in _VALID_STATUSES:
-            raise ValidationError(
-                f"Invalid subscription status: '{status}'. "
-                f"Must be one of: {', '.join(sorted(_VALID_STATUSES))}"
-            )
+        if isinstance(status, str):
+            status = SubscriptionStatus.from_label(status)
         self.tenant_id = tenant_id
         self.plan = plan
-        self.status = status
+        self.status: SubscriptionStatus = status
         self.current_period_start = current_period_start
         self.current_period_end = current_period_end
         self.stripe_subscription_id = stripe_subscription_id
@@ -67,13 +78,13 @@ class Subscription(AggregateRoot):
         Raises:
             ValidationError: If the subscription is not active.
         """
-        if self.status != "active":
+        if not (_ALLOWED_SOURCES[SubscriptionStatus.CANCELLED] >> self.status) & 1:
             raise ValidationError(
-                f"Cannot cancel subscription with status '{self.status}'. "
+                f"Cannot cancel subscription with status '{self.status.label}'. "
                 "Only active subscriptions can be cancelled."
             )
-        self.status = "cancelled"
-        self.updated_at = datetime.utcnow()
+        self.status = SubscriptionStatus.CANCELLED
+        self.updated_at = datetime.now(UTC).replace(tzinfo=None)
         self._add_event(
             DomainEvent(
                 event_type="SubscriptionCancelled",
@@ -90,13 +101,13 @@ class Subscription(AggregateRoot):
         Raises:
             ValidationError: If the subscription is not active.
         """
-        if self.status != "active":
+        if not (_ALLOWED_SOURCES[SubscriptionStatus.EXPIRED] >> self.status) & 1:
             raise ValidationError(
-                f"Cannot expire subscription with status '{self.status}'. "
+                f"Cannot expire subscription with status '{self.status.label}'. "
                 "Only active subscriptions can expire."
             )
-        self.status = "expired"
-        self.updated_at = datetime.utcnow()
+        self.status = SubscriptionStatus.EXPIRED
+        self.updated_at = datetime.now(UTC).replace(tzinfo=None)
         self._add_event(
             DomainEvent(
                 event_type="SubscriptionExpired",
@@ -124,6 +135,8 @@ class UsageRecord(BaseEntity):
         ValidationError: If quantity is negative or resource_type is empty.
     """
 
+    __slots__ = ("tenant_id", "resource_type", "quantity", "recorded_at")
+
     def __init__(
         self,
         tenant_id: uuid.UUID,
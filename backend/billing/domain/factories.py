@@ -5,10 +5,10 @@ invariants are satisfied upon construction.
 """
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from billing.domain.entities import Subscription
-from billing.domain.value_objects import Plan
+from billing.domain.value_objects import Plan, SubscriptionStatus
 from shared.domain.domain_event import DomainEvent
 
 # Default billing period length (days)
@@ -27,6 +27,7 @@ class SubscriptionFactory:
         tenant_id: uuid.UUID,
         plan: Plan,
         stripe_subscription_id: str | None = None,
+        now: datetime | None = None,
     ) -> Subscription:
         """Create a new active Subscription with default period dates.
 
@@ -34,15 +35,19 @@ class SubscriptionFactory:
             tenant_id: UUID of the owning tenant.
             plan: The subscription plan tier (FREE, PRO, ENTERPRISE).
             stripe_subscription_id: Optional external Stripe ID.
+            now: Period start; pass one shared value when creating in bulk.
+                Defaults to the current time.
 
         Returns:
             A fully constructed active Subscription with a 30-day period.
         """
-        now = datetime.utcnow()
+        if now is None:
+            # Naive UTC, matching the DateTime columns it is stored in
+            now = datetime.now(UTC).replace(tzinfo=None)
         subscription = Subscription(
             tenant_id=tenant_id,
             plan=plan,
-            status="active",
+            status=SubscriptionStatus.ACTIVE,
             current_period_start=now,
             current_period_end=now + timedelta(days=_DEFAULT_PERIOD_DAYS),
             stripe_subscription_id=stripe_subscription_id,
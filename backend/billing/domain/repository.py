@@ -7,6 +7,7 @@ All methods must enforce tenant isolation via tenant_id scoping.
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
 
 from billing.domain.entities import Subscription, UsageRecord
@@ -75,6 +76,15 @@ class IUsageRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def save_many(self, usage_records: Sequence[UsageRecord]) -> None:
+        """Persist a batch of new usage records in one statement.
+
+        Args:
+            usage_records: The UsageRecord entities to persist.
+        """
+        ...
+
     @abstractmethod
     async def find_by_tenant_and_period(
         self,
@@ -8,7 +8,7 @@ framework imports allowed.
 from __future__ import annotations
 
 from billing.domain.entities import Subscription
-from billing.domain.value_objects import get_quota_for_plan
+from billing.domain.value_objects import SubscriptionStatus, get_quota_for_plan
 from shared.domain.exceptions import QuotaExceededError, ValidationError
 
 
@@ -80,8 +80,8 @@ class QuotaEnforcementService:
     @staticmethod
     def _assert_active(subscription: Subscription) -> None:
         """Raise if the subscription is not in active status."""
-        if subscription.status != "active":
+        if subscription.status is not SubscriptionStatus.ACTIVE:
             raise ValidationError(
-                f"Subscription is {subscription.status}, "
+                f"Subscription is {subscription.status.label}, "
                 "only active subscriptions may consume quota"
             )
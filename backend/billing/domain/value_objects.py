@@ -2,12 +2,13 @@
 
 This module contains value objects for the billing domain:
 - Plan: Enumeration of subscription plans (free, pro, enterprise)
+- SubscriptionStatus: Subscription lifecycle state (active, cancelled, expired)
 - Quota: Represents usage limits for a plan (max optimizations, max tokens per month)
 - get_quota_for_plan: Maps a Plan to its default Quota limits
 """
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
 from shared.domain.base_value_object import BaseValueObject
 from shared.domain.exceptions import ValidationError
@@ -25,7 +26,39 @@ class Plan(str, Enum):  # noqa: UP042
     ENTERPRISE = "enterprise"
 
 
-@dataclass(frozen=True)
+class SubscriptionStatus(IntEnum):
+    """Subscription lifecycle state.
+
+    Stored as small integers so transition checks are a bit test; the
+    lowercase ``label`` is what gets persisted and exposed externally.
+    """
+
+    ACTIVE = 0
+    CANCELLED = 1
+    EXPIRED = 2
+
+    @property
+    def label(self) -> str:
+        """External string form, e.g. ``"active"``."""
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> "SubscriptionStatus":
+        """Parse the external string form.
+
+        Raises:
+            ValidationError: If the label is not a known status.
+        """
+        try:
+            return cls[label.upper()]
+        except KeyError:
+            valid = ", ".join(s.label for s in cls)
+            raise ValidationError(
+                f"Invalid subscription status: '{label}'. Must be one of: {valid}"
+            ) from None
+
+
+@dataclass(frozen=True, slots=True)
 class Quota(BaseValueObject):
     """Usage limits for a subscription plan.
 
@@ -26,7 +26,8 @@ class SubscriptionModel(Base):
     """ORM model for the 'subscriptions' table."""
 
     __tablename__ = "subscriptions"
-    __table_args__ = (Index("ix_subscriptions_tenant_id", "tenant_id"),)
+    # Leading tenant_id also serves the tenant-only lookups
+    __table_args__ = (Index("ix_subscriptions_tenant_status", "tenant_id", "status"),)
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
@@ -52,11 +53,22 @@ class UsageRecordModel(Base):
 
     __tablename__ = "usage_records"
     __table_args__ = (
-        Index("ix_usage_records_tenant_id", "tenant_id"),
+        # Tenant + period range scans; INCLUDE makes it covering on Postgres
+        # for queries that only need the usage columns
         Index(
-            "ix_usage_records_tenant_resource",
+            "ix_usage_records_tenant_recorded",
+            "tenant_id",
+            "recorded_at",
+            postgresql_include=["resource_type", "quantity"],
+        ),
+        # Serves the tenant + resource + period filters in UsageRepository;
+        # quantity is included so the SUM is answered from the index alone
+        Index(
+            "ix_usage_records_tenant_resource_recorded",
             "tenant_id",
             "resource_type",
+            "recorded_at",
+            postgresql_include=["quantity"],
         ),
     )
 
@@ -6,14 +6,16 @@ All queries are scoped by tenant_id to enforce multi-tenant isolation.
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from billing.domain.entities import Subscription, UsageRecord
 from billing.domain.repository import ISubscriptionRepository, IUsageRepository
-from billing.domain.value_objects import Plan
+from billing.domain.value_objects import Plan, SubscriptionStatus
 from billing.infrastructure.models import SubscriptionModel, UsageRecordModel
 
 
@@ -40,13 +42,18 @@ class SubscriptionRepository(ISubscriptionRepository):
     async def find_active_by_tenant_id(
         self, tenant_id: uuid.UUID
     ) -> Subscription | None:
-        """Find the active subscription for a tenant."""
-        stmt = select(SubscriptionModel).where(
-            SubscriptionModel.tenant_id == tenant_id,
-            SubscriptionModel.status == "active",
+        """Find the active subscription for a tenant (newest if several)."""
+        stmt = (
+            select(SubscriptionModel)
+            .where(
+                SubscriptionModel.tenant_id == tenant_id,
+                SubscriptionModel.status == SubscriptionStatus.ACTIVE.label,
+            )
+            .order_by(SubscriptionModel.created_at.desc())
+            .limit(1)
         )
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        model = result.scalars().first()
         return self._to_domain(model) if model else None
 
     # --- Mappers ---
@@ -57,7 +64,7 @@ class SubscriptionRepository(ISubscriptionRepository):
         sub = Subscription(
             tenant_id=model.tenant_id,
             plan=Plan(model.plan),
-            status=model.status,
+            status=SubscriptionStatus.from_label(model.status),
             current_period_start=model.current_period_start,
             current_period_end=model.current_period_end,
             stripe_subscription_id=model.stripe_subscription_id,
@@ -74,7 +81,7 @@ class SubscriptionRepository(ISubscriptionRepository):
             id=entity.id,
             tenant_id=entity.tenant_id,
             plan=entity.plan.value,
-            status=entity.status,
+            status=entity.status.label,
             current_period_start=entity.current_period_start,
             current_period_end=entity.current_period_end,
             stripe_subscription_id=entity.stripe_subscription_id,
@@ -84,19 +91,31 @@ class SubscriptionRepository(ISubscriptionRepository):
 
 
 class UsageRepository(IUsageRepository):
-    """SQLAlchemy implementation of usage record data access."""
+    """SQLAlchemy implementation of usage record data access.
+
+    Usage records are append-only rows with no aggregate behaviour, so
+    this repository uses Core insert/select statements and skips the
+    ORM unit of work and identity map entirely.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def save(self, usage_record: UsageRecord) -> UsageRecord:
         """Persist a new usage record."""
-        model = self._to_model(usage_record)
-        merged = await self._session.merge(model)
-        await self._session.flush()
-        usage_record.id = merged.id
+        await self._session.execute(
+            insert(UsageRecordModel).values(**self._to_row(usage_record))
+        )
         return usage_record
 
+    async def save_many(self, usage_records: Sequence[UsageRecord]) -> None:
+        """Persist new usage records via a single executemany INSERT."""
+        if not usage_records:
+            return
+        await self._session.execute(
+            insert(UsageRecordModel), [self._to_row(r) for r in usage_records]
+        )
+
     async def find_by_tenant_and_period(
         self,
         tenant_id: uuid.UUID,
@@ -104,13 +123,13 @@ class UsageRepository(IUsageRepository):
         period_end: datetime,
     ) -> list[UsageRecord]:
         """Find usage records for a tenant within a billing period."""
-        stmt = select(UsageRecordModel).where(
+        stmt = select(*UsageRecordModel.__table__.c).where(
             UsageRecordModel.tenant_id == tenant_id,
             UsageRecordModel.recorded_at >= period_start,
             UsageRecordModel.recorded_at < period_end,
         )
         result = await self._session.execute(stmt)
-        return [self._to_domain(m) for m in result.scalars().all()]
+        return [self._to_domain(row) for row in result.mappings()]
 
     async def get_usage_summary(
         self,
@@ -132,26 +151,26 @@ class UsageRepository(IUsageRepository):
     # --- Mappers ---
 
     @staticmethod
-    def _to_domain(model: UsageRecordModel) -> UsageRecord:
-        """Convert ORM model to domain entity."""
+    def _to_domain(row: RowMapping) -> UsageRecord:
+        """Convert a usage_records row to a domain entity."""
         record = UsageRecord(
-            tenant_id=model.tenant_id,
-            resource_type=model.resource_type,
-            quantity=model.quantity,
-            recorded_at=model.recorded_at,
+            tenant_id=row["tenant_id"],
+            resource_type=row["resource_type"],
+            quantity=row["quantity"],
+            recorded_at=row["recorded_at"],
         )
-        record.id = model.id
-        record.created_at = model.created_at
+        record.id = row["id"]
+        record.created_at = row["created_at"]
         return record
 
     @staticmethod
-    def _to_model(entity: UsageRecord) -> UsageRecordModel:
-        """Convert domain entity to ORM model."""
-        return UsageRecordModel(
-            id=entity.id,
-            tenant_id=entity.tenant_id,
-            resource_type=entity.resource_type,
-            quantity=entity.quantity,
-            recorded_at=entity.recorded_at,
-            created_at=entity.created_at,
-        )
+    def _to_row(entity: UsageRecord) -> dict[str, Any]:
+        """Convert domain entity to an insert parameter dict."""
+        return {
+            "id": entity.id,
+            "tenant_id": entity.tenant_id,
+            "resource_type": entity.resource_type,
+            "quantity": entity.quantity,
+            "recorded_at": entity.recorded_at,
+            "created_at": entity.created_at,
+        }
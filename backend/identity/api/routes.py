@@ -46,7 +46,7 @@ async def get_auth_service(  # noqa: B008
     return AuthApplicationService(
         user_repo=UserRepository(session),
         tenant_repo=TenantRepository(session),
-        hasher=PasswordHashingService(),
+        hasher=PasswordHashingService(rounds=settings.bcrypt_rounds),
         jwt_service=JWTService(settings),
         uow=SqlAlchemyUnitOfWork(session),
     )
@@ -3,6 +3,7 @@
 All request/response models use Pydantic for validation.
 """
 
+import uuid
 from datetime import datetime
 
 from pydantic import BaseModel, EmailStr, Field
@@ -41,8 +42,8 @@ class TokenResponse(BaseModel):
 class UserDTO(BaseModel):
     """Public user representation (excludes password hash)."""
 
-    id: str
+    id: uuid.UUID
     email: str
     role: str
-    tenant_id: str
+    tenant_id: uuid.UUID
     created_at: datetime
@@ -138,9 +138,9 @@ class AuthApplicationService:
 def user_to_dto(user: User) -> UserDTO:
     """Convert a domain User entity to a UserDTO."""
     return UserDTO(
-        id=str(user.id),
+        id=user.id,
         email=user.email.value,
         role=user.role.value,
-        tenant_id=str(user.tenant_id),
+        tenant_id=user.tenant_id,
         created_at=user.created_at,
     )
@@ -4,14 +4,30 @@ Domain services contain business logic that doesn't naturally fit
 within entities or value objects.
 """
 
+from functools import lru_cache
+
 from passlib.context import CryptContext  # type: ignore[import-untyped]
 
-# bcrypt context — configured once, reused across calls
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib's bcrypt default work factor
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+@lru_cache(maxsize=4)
+def _pwd_context(rounds: int) -> CryptContext:
+    """Return the bcrypt context for ``rounds`` (built once per value)."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
 
 
 class PasswordHashingService:
-    """Handles password hashing and verification using bcrypt."""
+    """Handles password hashing and verification using bcrypt.
+
+    Args:
+        rounds: bcrypt work factor for new hashes. Verification reads
+            the factor from the stored hash, so it accepts any value.
+    """
+
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> None:
+        self._context = _pwd_context(rounds)
 
     def hash_password(self, raw_password: str) -> str:
         """Hash a plaintext password.
@@ -22,7 +38,7 @@ class PasswordHashingService:
         Returns:
             The bcrypt hash string.
         """
-        result: str = _pwd_context.hash(raw_password)
+        result: str = self._context.hash(raw_password)
         return result
 
     def verify_password(self, raw_password: str, hashed_password: str) -> bool:
@@ -35,5 +51,5 @@ class PasswordHashingService:
         Returns:
             True if the password matches, False otherwise.
         """
-        result: bool = _pwd_context.verify(raw_password, hashed_password)
+        result: bool = self._context.verify(raw_password, hashed_password)
         return result
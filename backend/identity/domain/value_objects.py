@@ -7,15 +7,30 @@ import re
 import uuid
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from shared.domain.base_value_object import BaseValueObject
 from shared.domain.exceptions import ValidationError
 
-# RFC 5322 simplified email regex
-_EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+# RFC 5322 simplified email regex, compiled once; ASCII-only by design
+_EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", re.ASCII)
+_EMAIL_MATCH = _EMAIL_REGEX.match
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _canonical_email(raw: str) -> str:
+    """Normalize and validate an email address (memoized; pure).
+
+    Raises:
+        ValidationError: If the normalized address is malformed.
+    """
+    normalized = raw.strip().lower()
+    if not _EMAIL_MATCH(normalized):
+        raise ValidationError(f"Invalid email format: {raw}")
+    return normalized
+
+
+@dataclass(frozen=True, slots=True)
 class Email(BaseValueObject):
     """Email address value object with format validation.
 
@@ -27,11 +42,8 @@ class Email(BaseValueObject):
 
     def __post_init__(self) -> None:
         """Validate and normalize email on construction."""
-        normalized = self.value.strip().lower()
-        if not _EMAIL_REGEX.match(normalized):
-            raise ValidationError(f"Invalid email format: {self.value}")
         # frozen dataclass requires object.__setattr__
-        object.__setattr__(self, "value", normalized)
+        object.__setattr__(self, "value", _canonical_email(self.value))
 
 
 class Role(str, Enum):  # noqa: UP042
@@ -42,7 +54,7 @@ class Role(str, Enum):  # noqa: UP042
     MEMBER = "member"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenantId(BaseValueObject):
     """Tenant identifier value object wrapping a UUID."""
 
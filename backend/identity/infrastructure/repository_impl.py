@@ -6,7 +6,7 @@ Must enforce tenant isolation on all queries.
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from identity.domain.entities import Tenant, User
@@ -14,6 +14,10 @@ from identity.domain.repository import ITenantRepository, IUserRepository
 from identity.domain.value_objects import Email, Role
 from identity.infrastructure.models import TenantModel, UserModel
 
+# Hot lookups built once at import; SQLAlchemy then only binds params
+_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("id"))
+_USER_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"))
+
 
 class UserRepository(IUserRepository):
     """SQLAlchemy implementation of user data access."""
@@ -23,8 +27,7 @@ class UserRepository(IUserRepository):
 
     async def find_by_id(self, user_id: uuid.UUID) -> User | None:
         """Find user by ID."""
-        stmt = select(UserModel).where(UserModel.id == user_id)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_USER_BY_ID, {"id": user_id})
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
@@ -40,8 +43,9 @@ class UserRepository(IUserRepository):
 
     async def find_by_email_any_tenant(self, email: str) -> User | None:
         """Find user by email across all tenants (for login)."""
-        stmt = select(UserModel).where(UserModel.email == email.lower().strip())
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(
+            _USER_BY_EMAIL, {"email": email.lower().strip()}
+        )
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
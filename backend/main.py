@@ -13,6 +13,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from config import get_settings
 from identity.api.routes import router as auth_router
 from resume.api.routes import router as resume_router
+from shared.infrastructure.database import engine, warm_pool
+from shared.middleware.rate_limit_middleware import RateLimitMiddleware
+from shared.middleware.tenant_middleware import TenantMiddleware
 
 
 @asynccontextmanager
@@ -21,11 +24,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     settings = get_settings()
     print(f"Starting JobFit AI [{settings.app_env}] ...")
-    # TODO(#4): Initialize DB pool, event bus, etc.
+    await warm_pool(settings.db_pool_prewarm)
+    # TODO(#4): Initialize event bus, etc.
     yield
     # Shutdown
     print("Shutting down JobFit AI ...")
-    # TODO(#4): Close DB pool, cleanup resources
+    await engine.dispose()
+    # TODO(#4): Cleanup remaining resources
 
 
 app = FastAPI(
@@ -37,7 +42,16 @@ app = FastAPI(
     redoc_url="/redoc" if not get_settings().is_production else None,
 )
 
-# --- CORS ---
+# Middleware added last runs first (outermost).
+
+# --- Rate limiting (runs inside TenantMiddleware to see the JWT payload) ---
+if get_settings().rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
+# --- Tenant context (decodes JWT once, before routing) ---
+app.add_middleware(TenantMiddleware)
+
+# --- CORS (outermost, so 429s and other early responses carry its headers) ---
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_settings().cors_origins,
@@ -8,6 +8,7 @@ Immutable, compared-by-value types:
     - GapReport      — missing skills, recommendations, transferable skills, priority
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -41,15 +42,18 @@ class SessionStatus(Enum):
         Returns:
             True if the transition is valid, False otherwise.
         """
-        return target in _TRANSITIONS.get(self, set())
-
-
-# Defined after SessionStatus so enum members exist
-_TRANSITIONS: dict[SessionStatus, set[SessionStatus]] = {
-    SessionStatus.PENDING: {SessionStatus.PROCESSING},
-    SessionStatus.PROCESSING: {SessionStatus.COMPLETED, SessionStatus.FAILED},
-    SessionStatus.COMPLETED: set(),
-    SessionStatus.FAILED: set(),
+        return target in _TRANSITIONS[self]
+
+
+# Defined after SessionStatus so enum members exist. Every status has an
+# entry, so lookups never need a default.
+_TRANSITIONS: dict[SessionStatus, frozenset[SessionStatus]] = {
+    SessionStatus.PENDING: frozenset({SessionStatus.PROCESSING}),
+    SessionStatus.PROCESSING: frozenset(
+        {SessionStatus.COMPLETED, SessionStatus.FAILED}
+    ),
+    SessionStatus.COMPLETED: frozenset(),
+    SessionStatus.FAILED: frozenset(),
 }
 
 
@@ -57,8 +61,11 @@ _TRANSITIONS: dict[SessionStatus, set[SessionStatus]] = {
 # ScoreBreakdown
 # ------------------------------------------------------------------
 
+# Category weights (keywords, skills, experience, formatting); sum to 1.0
+_SCORE_WEIGHTS: tuple[float, float, float, float] = (0.35, 0.30, 0.25, 0.10)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreBreakdown(BaseValueObject):
     """Per-category ATS score breakdown.
 
@@ -88,20 +95,34 @@ class ScoreBreakdown(BaseValueObject):
 
         Weights: keywords=0.35, skills=0.30, experience=0.25, formatting=0.10
         """
+        wk, ws, we, wf = _SCORE_WEIGHTS
         return (
-            self.keywords * 0.35
-            + self.skills * 0.30
-            + self.experience * 0.25
-            + self.formatting * 0.10
+            self.keywords * wk
+            + self.skills * ws
+            + self.experience * we
+            + self.formatting * wf
         )
 
+    @staticmethod
+    def batch_weighted(breakdowns: Iterable["ScoreBreakdown"]) -> list[float]:
+        """Return ``weighted_overall()`` for many breakdowns in one pass.
+
+        Unpacks the weights once instead of once per breakdown; useful
+        when scoring several rewrite attempts together.
+        """
+        wk, ws, we, wf = _SCORE_WEIGHTS
+        return [
+            b.keywords * wk + b.skills * ws + b.experience * we + b.formatting * wf
+            for b in breakdowns
+        ]
+
 
 # ------------------------------------------------------------------
 # JDAnalysis
 # ------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JDAnalysis(BaseValueObject):
     """Structured analysis extracted from a job description.
 
@@ -138,7 +159,7 @@ class JDAnalysis(BaseValueObject):
 # ------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ATSScore(BaseValueObject):
     """Overall ATS compatibility score with per-category breakdown."""
 
@@ -166,7 +187,7 @@ class ATSScore(BaseValueObject):
 # ------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GapReport(BaseValueObject):
     """Gap analysis between resume and JD requirements.
 
@@ -87,8 +87,8 @@ async def upload_resume(  # noqa: B008
 
     try:
         cmd = UploadResumeCommand(
-            user_id=user.id,
-            tenant_id=user.tenant_id,
+            user_id=str(user.id),
+            tenant_id=str(user.tenant_id),
             filename=file.filename or "resume.pdf",
             file_bytes=file_bytes,
         )
@@ -109,7 +109,9 @@ async def list_resumes(  # noqa: B008
     service: ResumeApplicationService = Depends(get_resume_service),
 ) -> list[ResumeListItemDTO]:
     """List all resumes for the current user."""
-    return await service.list_resumes(user_id=user.id, tenant_id=user.tenant_id)
+    return await service.list_resumes(
+        user_id=str(user.id), tenant_id=str(user.tenant_id)
+    )
 
 
 @router.get(
@@ -123,7 +125,9 @@ async def get_resume(  # noqa: B008
 ) -> ResumeDetailDTO:
     """Get resume detail with all parsed sections."""
     try:
-        return await service.get_resume(resume_id=resume_id, tenant_id=user.tenant_id)
+        return await service.get_resume(
+            resume_id=resume_id, tenant_id=str(user.tenant_id)
+        )
     except EntityNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -142,7 +146,7 @@ async def delete_resume(  # noqa: B008
 ) -> None:
     """Delete a resume and its stored file."""
     try:
-        await service.delete_resume(resume_id=resume_id, tenant_id=user.tenant_id)
+        await service.delete_resume(resume_id=resume_id, tenant_id=str(user.tenant_id))
     except EntityNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
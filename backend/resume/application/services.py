@@ -4,6 +4,7 @@ Coordinates between domain objects, infrastructure adapters,
 and the unit of work for transactional consistency.
 """
 
+import asyncio
 import logging
 import uuid
 
@@ -62,8 +63,8 @@ class ResumeApplicationService:
             file_bytes=cmd.file_bytes,
         )
 
-        # 2. Extract text from PDF
-        raw_text = self._parser.extract_text(cmd.file_bytes)
+        # 2. Extract text from PDF (CPU-bound; keep it off the event loop)
+        raw_text = await asyncio.to_thread(self._parser.extract_text, cmd.file_bytes)
 
         # 3. Create Resume aggregate via factory
         resume = ResumeFactory.create_from_upload(
@@ -56,24 +56,22 @@ class ResumeParsingDomainService:
             and the text content of that section. If no headings
             are found, returns the entire text as SUMMARY.
         """
-        matches = list(_HEADING_PATTERN.finditer(raw_text))
+        # split() with one capturing group yields
+        # [preamble, heading, content, heading, content, ...]
+        parts = _HEADING_PATTERN.split(raw_text)
 
-        if not matches:
+        if len(parts) == 1:
             # No recognized headings — treat as single summary
             return [(SectionType.SUMMARY, raw_text.strip())]
 
         sections: list[tuple[SectionType, str]] = []
 
-        for i, match in enumerate(matches):
-            heading_text = match.group(1).strip().lower()
-            section_type = _HEADING_MAP.get(heading_text, SectionType.SUMMARY)
-
-            # Content runs from end of heading to start of next
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(raw_text)
-            content = raw_text[start:end].strip()
-
+        for heading, body in zip(parts[1::2], parts[2::2], strict=True):
+            content = body.strip()
             if content:
+                # IGNORECASE matches Unicode case variants (e.g. "ſkills")
+                # whose lower() is not a key; those fall back to SUMMARY.
+                section_type = _HEADING_MAP.get(heading.lower(), SectionType.SUMMARY)
                 sections.append((section_type, content))
 
         return sections
@@ -21,7 +21,7 @@ class SectionType(str, Enum):  # noqa: UP042
     SUMMARY = "summary"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedContent(BaseValueObject):
     """Immutable snapshot of a parsed resume.
 
@@ -1,18 +1,23 @@
-"""PDFParser — PyPDF2 adapter for text extraction (Adapter pattern).
+"""PDFParser — pypdfium2 adapter for text extraction (Adapter pattern).
 
-Wraps PyPDF2 to extract raw text from uploaded PDF resumes.
+Wraps pypdfium2 (bindings to Google's PDFium C++ engine) to extract
+raw text from uploaded PDF resumes.
 """
 
-import io
 import logging
+import threading
 
-from PyPDF2 import PdfReader
+import pypdfium2 as pdfium
 
 logger = logging.getLogger(__name__)
 
+# PDFium is not thread-safe; calls are serialized per process. Parsing
+# still runs off the event loop (see ResumeApplicationService.upload).
+_pdfium_lock = threading.Lock()
+
 
 class PDFParser:
-    """Extracts text from PDF file bytes using PyPDF2."""
+    """Extracts text from PDF file bytes using pypdfium2."""
 
     def extract_text(self, file_bytes: bytes) -> str:
         """Extract all text from a PDF file.
@@ -27,18 +32,29 @@ class PDFParser:
             ValueError: If the file cannot be parsed as PDF.
         """
         try:
-            reader = PdfReader(io.BytesIO(file_bytes))
-            pages: list[str] = []
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    pages.append(text)
+            with _pdfium_lock:
+                doc = pdfium.PdfDocument(file_bytes)
+                try:
+                    pages = [text for page in doc if (text := _page_text(page))]
+                    page_count = len(doc)
+                finally:
+                    doc.close()
             result = "\n".join(pages)
             logger.info(
                 "Extracted %d chars from %d pages",
                 len(result),
-                len(reader.pages),
+                page_count,
             )
             return result
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {e}") from e
+
+
+def _page_text(page: pdfium.PdfPage) -> str:
+    """Return a page's text, releasing its PDFium handles immediately."""
+    textpage = page.get_textpage()
+    try:
+        return str(textpage.get_text_range())
+    finally:
+        textpage.close()
+        page.close()
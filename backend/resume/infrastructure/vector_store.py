@@ -11,15 +11,20 @@ unreachable — a failed embedding must never block a resume upload.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Any, cast
-
-import chromadb
-from chromadb.api import ClientAPI
-from chromadb.api.types import EmbeddingFunction, Where
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast
 
 from config import Settings
 
+# chromadb takes about a second to import; load it on first use only.
+if TYPE_CHECKING:
+    import chromadb
+    from chromadb.api import ClientAPI
+    from chromadb.api.types import EmbeddingFunction, Where
+
 logger = logging.getLogger(__name__)
 
 # Distance metric used for all collections.  Cosine similarity is
@@ -31,6 +36,14 @@ _DISTANCE_METRIC = "cosine"
 _MIN_RELEVANCE_SCORE = 0.0
 
 
+def _sections_digest(sections: list[dict[str, Any]]) -> str:
+    """Return a SHA-256 hex digest of the sections' types and contents."""
+    payload = json.dumps(
+        [[section["type"], section["content"]] for section in sections]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 def _build_openai_embedding_fn(
     api_key: str,
 ) -> EmbeddingFunction[list[str]] | None:
@@ -87,6 +100,8 @@ class VectorStoreAdapter:
             self._client = client
         else:
             try:
+                import chromadb
+
                 self._client = chromadb.HttpClient(
                     host=settings.chroma_host,
                     port=settings.chroma_port,
@@ -136,6 +151,43 @@ class VectorStoreAdapter:
             kwargs["embedding_function"] = self._embedding_fn
         return self._client.get_or_create_collection(**kwargs)
 
+    @staticmethod
+    def _find_stored_embeddings(
+        collection: chromadb.Collection,
+        digest: str,
+        count: int,
+    ) -> tuple[str, list[list[float]]] | None:
+        """Look up a complete set of vectors already stored for *digest*.
+
+        Args:
+            collection: The tenant's collection.
+            digest: ``_sections_digest`` of the sections to store.
+            count: Number of sections; a match must cover all of them.
+
+        Returns:
+            ``(resume_id, vectors)`` of one resume whose chunks carry
+            *digest*, vectors in section order, or ``None``.
+        """
+        stored = collection.get(
+            where=cast("Where", {"content_digest": digest}),
+            include=["embeddings", "metadatas"],
+        )
+        vectors = stored["embeddings"]
+        if vectors is None or not stored["metadatas"]:
+            return None
+
+        by_resume: dict[str, dict[int, list[float]]] = {}
+        for metadata, vector in zip(stored["metadatas"], vectors, strict=True):
+            chunks = by_resume.setdefault(str(metadata["resume_id"]), {})
+            chunks[int(cast("int", metadata["order_index"]))] = [
+                float(x) for x in vector
+            ]
+
+        for resume_id, chunks in by_resume.items():
+            if sorted(chunks) == list(range(count)):
+                return resume_id, [chunks[idx] for idx in range(count)]
+        return None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -145,6 +197,7 @@ class VectorStoreAdapter:
         tenant_id: str,
         resume_id: str,
         sections: list[dict[str, Any]],
+        embeddings: Sequence[Sequence[float]] | None = None,
     ) -> None:
         """Embed and store resume sections in ChromaDB.
 
@@ -153,10 +206,19 @@ class VectorStoreAdapter:
         ``order_index``.  Uses ``upsert`` so repeated uploads of the
         same resume overwrite previous embeddings cleanly.
 
+        Chunks also carry a ``content_digest`` of all the sections. If
+        the tenant's collection already holds the same sections (e.g.
+        the same PDF uploaded again under a new resume id), their
+        vectors are copied instead of calling the embedding function;
+        if they are already stored under *resume_id*, nothing is written.
+
         Args:
             tenant_id: Tenant UUID string for collection isolation.
             resume_id: Resume UUID string.
             sections: List of dicts, each with ``type`` and ``content``.
+            embeddings: Optional precomputed vectors, one per section,
+                from the collection's embedding function. When given,
+                ChromaDB stores them as-is instead of embedding again.
         """
         if not self._available:
             logger.warning(
@@ -168,28 +230,43 @@ class VectorStoreAdapter:
         if not sections:
             return
 
+        digest = _sections_digest(sections)
+
         try:
             collection = self._get_collection(tenant_id)
 
-            ids: list[str] = []
-            documents: list[str] = []
-            metadatas: list[dict[str, Any]] = []
-
-            for idx, section in enumerate(sections):
-                ids.append(f"{resume_id}_{idx}")
-                documents.append(section["content"])
-                metadatas.append(
-                    {
-                        "resume_id": resume_id,
-                        "section_type": section["type"],
-                        "order_index": idx,
-                    }
-                )
+            if embeddings is None:
+                found = self._find_stored_embeddings(collection, digest, len(sections))
+                if found is not None:
+                    source_id, embeddings = found
+                    if source_id == resume_id:
+                        logger.debug("Resume %s unchanged — not re-stored", resume_id)
+                        return
+                    logger.info(
+                        "Reusing embeddings of resume %s for resume %s",
+                        source_id,
+                        resume_id,
+                    )
+
+            # One upsert for the whole resume: ChromaDB embeds the batch
+            # in a single call to the embedding function.
+            ids = [f"{resume_id}_{idx}" for idx in range(len(sections))]
+            documents: list[str] = [section["content"] for section in sections]
+            metadatas: list[dict[str, Any]] = [
+                {
+                    "resume_id": resume_id,
+                    "section_type": section["type"],
+                    "order_index": idx,
+                    "content_digest": digest,
+                }
+                for idx, section in enumerate(sections)
+            ]
 
             collection.upsert(
                 ids=ids,
                 documents=documents,
                 metadatas=metadatas,  # type: ignore[arg-type]
+                embeddings=embeddings,  # type: ignore[arg-type]
             )
             logger.info(
                 "Stored %d embeddings for resume %s in tenant %s",
@@ -236,7 +313,7 @@ class VectorStoreAdapter:
 
             where_filter: Where | None = None
             if resume_id is not None:
-                where_filter = cast(Where, {"resume_id": resume_id})
+                where_filter = cast("Where", {"resume_id": resume_id})
 
             results = collection.query(
                 query_texts=[query],
@@ -17,6 +17,8 @@ class AggregateRoot(BaseEntity):
     collect_events() after committing to dispatch them via the event bus.
     """
 
+    __slots__ = ("_events",)
+
     def __init__(self) -> None:
         super().__init__()
         self._events: list[DomainEvent] = []
@@ -14,8 +14,13 @@ class BaseEntity:
     Entities have a unique identity (UUID) and are compared by that identity,
     not by their attribute values. Two entities with the same id are considered
     equal, regardless of other field differences.
+
+    Subclasses may declare ``__slots__`` for their own attributes; those
+    that don't simply keep a per-instance ``__dict__``.
     """
 
+    __slots__ = ("id", "created_at", "updated_at")
+
     def __init__(self) -> None:
         self.id: uuid.UUID = uuid.uuid4()
         self.created_at: datetime = datetime.utcnow()
@@ -7,14 +7,15 @@ are considered equal. They should be implemented as frozen dataclasses.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseValueObject:
     """Base class for all domain value objects.
 
     Value objects are immutable (frozen=True) and compared by their field
-    values. Subclasses inherit this behavior — just add fields:
+    values. Subclasses inherit this behavior — just add fields, and pass
+    ``slots=True`` so instances stay free of a per-object ``__dict__``:
 
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class Email(BaseValueObject):
             value: str
     """
@@ -3,18 +3,41 @@
 Provides get_async_session() dependency for FastAPI injection.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
+
+from config import Settings, get_settings
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Build create_async_engine() keyword arguments for the configured URL."""
+    url = make_url(settings.database_url)
+    options: dict[str, Any] = {"echo": settings.is_development}
+    if url.get_backend_name() != "postgresql":
+        options["pool_pre_ping"] = True
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        # Pooled connections are pre-warmed and reused; skip the per-checkout ping
+        pool_pre_ping=False,
+    )
+    if url.get_driver_name() == "asyncpg":
+        # Short OLTP queries never benefit from JIT; it only adds planning time
+        options["connect_args"] = {"server_settings": {"jit": "off"}}
+    return options
 
-from config import get_settings
 
 # --- Async Engine (Singleton) ---
 engine = create_async_engine(
-    get_settings().database_url,
-    echo=get_settings().is_development,
-    pool_pre_ping=True,
+    get_settings().database_url, **_engine_options(get_settings())
 )
 
 # --- Session Factory ---
@@ -22,6 +45,8 @@ AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    # Repositories flush explicitly in save(); no implicit flush before queries
+    autoflush=False,
 )
 
 
@@ -32,6 +57,23 @@ class Base(DeclarativeBase):
     pass
 
 
+async def warm_pool(size: int) -> None:
+    """Open ``size`` pooled connections concurrently so they are ready for use.
+
+    Args:
+        size: Number of connections to open (capped at the pool size;
+            non-queue pools such as SQLite's only get one).
+    """
+    pool = engine.pool
+    size = min(size, pool.size() if isinstance(pool, QueuePool) else 1)
+
+    async def _touch() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_touch() for _ in range(size)))
+
+
 # --- FastAPI Dependency ---
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session, auto-closed after request."""
@@ -10,6 +10,7 @@ so a failing handler cannot break the publishing aggregate's flow.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections import defaultdict
 
@@ -50,21 +51,33 @@ class InProcessEventBus(IEventBus):
     async def publish(self, event: DomainEvent) -> None:
         """Fan out a domain event to all subscribed handlers.
 
-        If no handlers are registered for the event type, the event
-        is silently ignored.  If a handler raises, the exception is
-        logged and remaining handlers still execute.
+        Handlers run concurrently, so a slow handler (e.g. one doing
+        I/O) doesn't delay the others.  If no handlers are registered
+        for the event type, the event is silently ignored.  If a handler
+        raises, the exception is logged and the remaining handlers
+        still complete.  Handlers subscribed during dispatch only see
+        later events.
 
         Args:
             event: The domain event to dispatch.
         """
-        handlers = self._handlers.get(event.event_type, [])
-        for handler in handlers:
-            try:
-                await handler(event)
-            except Exception:
-                logger.exception(
+        # Snapshot: a handler may subscribe more handlers while awaited
+        handlers = tuple(self._handlers.get(event.event_type, ()))
+        if not handlers:
+            return
+        results = await asyncio.gather(
+            *(handler(event) for handler in handlers),
+            return_exceptions=True,
+        )
+        for handler, result in zip(handlers, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
                     "Handler %s failed for event '%s' (id=%s)",
                     handler.__qualname__,
                     event.event_type,
                     event.event_id,
+                    exc_info=result,
                 )
+            elif isinstance(result, BaseException):
+                # Cancellation and friends keep propagating as before.
+                raise result
@@ -5,7 +5,7 @@ Wraps an AsyncSession and provides commit/rollback semantics.
 
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
 from shared.application.unit_of_work import IUnitOfWork
 
@@ -18,21 +18,37 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         async with SqlAlchemyUnitOfWork(session) as uow:
             repo.save(entity)
             await uow.commit()
+
+    Entering the context begins an explicit transaction (unless the
+    session already has one), which commit()/rollback() then end.
+    Used without ``async with``, it falls back to the session's own
+    implicit transaction.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._tx: AsyncSessionTransaction | None = None
 
     async def commit(self) -> None:
         """Commit the current transaction."""
-        await self._session.commit()
+        if self._tx is not None and self._tx.is_active:
+            await self._tx.commit()
+        else:
+            await self._session.commit()
+        self._tx = None
 
     async def rollback(self) -> None:
         """Roll back the current transaction."""
-        await self._session.rollback()
+        if self._tx is not None and self._tx.is_active:
+            await self._tx.rollback()
+        else:
+            await self._session.rollback()
+        self._tx = None
 
     async def __aenter__(self) -> SqlAlchemyUnitOfWork:
-        """Enter the transactional context."""
+        """Enter the transactional context, beginning a transaction."""
+        if not self._session.in_transaction():
+            self._tx = await self._session.begin()
         return self
 
     async def __aexit__(
@@ -1,14 +1,19 @@
 """JWT authentication middleware — FastAPI dependencies.
 
 Provides get_current_user() and get_current_active_user()
-dependencies for protected API endpoints.
+dependencies for protected API endpoints, and decode_token_cached()
+for other middleware that needs the JWT payload.
 """
 
+import hashlib
+import time
 import uuid
+from functools import lru_cache
+from typing import Any
 
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_settings
@@ -23,21 +28,79 @@ from shared.infrastructure.tenant_context import TenantContext
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+@lru_cache(maxsize=1)
+def _jwt_service() -> JWTService:
+    """Return the process-wide JWTService (cache_clear() to rebuild)."""
+    return JWTService(get_settings())
+
+
+# Decoded payloads keyed by token digest (never the raw token).
+# Entries live at most 30s and never past the token's own `exp`.
+_payload_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=30)
+
+# Digests of tokens that recently failed verification, so replayed junk
+# is turned away without another signature check.
+_rejected_cache: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=10)
+
+# Real tokens are well under this; anything larger is not worth decoding.
+_MAX_TOKEN_LENGTH = 8192
+
+
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """Decode a JWT, reusing a recent successful decode when possible.
+
+    Args:
+        token: The encoded JWT string.
+
+    Returns:
+        The decoded payload as a dict.
+
+    Raises:
+        AuthenticationError: If the token is expired, invalid, or malformed.
+    """
+    # Cheap shape check first: header.payload.signature, bounded size
+    if token.count(".") != 2 or len(token) > _MAX_TOKEN_LENGTH:
+        raise AuthenticationError("Malformed token")
+
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    payload = _payload_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        # Token expired while cached — let decode_token raise
+        _payload_cache.pop(key, None)
+
+    rejected = _rejected_cache.get(key)
+    if rejected is not None:
+        raise AuthenticationError(rejected)
+
+    try:
+        payload = _jwt_service().decode_token(token)
+    except AuthenticationError as e:
+        _rejected_cache[key] = str(e)
+        raise
+    _payload_cache[key] = payload
+    return payload
+
+
 async def get_current_user(  # noqa: B008
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_async_session),
 ) -> UserDTO:
     """Decode JWT and return the authenticated user.
 
-    Also sets the TenantContext for downstream repository usage.
+    Reuses the payload decoded by TenantMiddleware when present and
+    also sets the TenantContext for downstream repository usage.
 
     Raises:
         HTTPException 401: If the token is invalid or
             the user is not found.
     """
     try:
-        jwt_service = JWTService(get_settings())
-        payload = jwt_service.decode_token(token)
+        payload = getattr(request.state, "jwt_payload", None) or decode_token_cached(
+            token
+        )
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,11 +112,10 @@ async def get_current_user(  # noqa: B008
     tenant_id = payload.get("tenant_id", "")
     TenantContext.set_current_tenant_id(tenant_id)
 
-    # Verify user still exists in database
-    user_id = payload.get("sub", "")
-    stmt = select(UserModel).where(UserModel.id == uuid.UUID(user_id))
-    result = await db.execute(stmt)
-    user_model = result.scalar_one_or_none()
+    # Verify user still exists; the primary-key lookup goes through the
+    # session identity map first
+    uid = uuid.UUID(payload.get("sub", ""))
+    user_model = await db.get(UserModel, uid)
 
     if user_model is None:
         raise HTTPException(
@@ -63,10 +125,10 @@ async def get_current_user(  # noqa: B008
         )
 
     return UserDTO(
-        id=str(user_model.id),
+        id=user_model.id,
         email=user_model.email,
         role=user_model.role,
-        tenant_id=str(user_model.tenant_id),
+        tenant_id=user_model.tenant_id,
         created_at=user_model.created_at,
     )
 
@@ -4,5 +4,173 @@ Applies per-tenant and per-user rate limits using Redis sorted sets
 with a sliding window algorithm.
 """
 
-# TODO(#32): Implement RateLimitMiddleware with Redis backend
+import logging
+import time
+import uuid
+
+from cachetools import TTLCache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window check in one atomic round trip:
+#   KEYS[1] = rate limit key
+#   ARGV    = [window_start_ms, limit, now_ms, window_seconds, member]
+# Returns {allowed, remaining, oldest_ms}.
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local n = redis.call('ZCARD', KEYS[1])
+if n < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[5])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return {1, tonumber(ARGV[2]) - n - 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+-- An empty window (limit 0) has no oldest hit; retry after a full window
+return {0, 0, tonumber(oldest[2] or ARGV[3])}
+"""
+
 # TODO(#33): Configure limits from tenant subscription plan
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware enforcing a sliding-window request limit.
+
+    Requests are bucketed by ``rl:{tenant_id}:{user_id}:{route_bucket}``
+    using the JWT payload stashed by TenantMiddleware (anonymous callers
+    are keyed by client address). Must be installed *inside*
+    TenantMiddleware so the payload is available.
+
+    A per-process token bucket holding ``local_fraction`` of the limit
+    sits in front of Redis: while it has tokens, requests are served
+    without a Redis round trip. Those hits are not recorded in Redis,
+    so the effective ceiling is ``limit * (1 + workers * local_fraction)``
+    — set ``local_fraction`` to 0 for exact limits.
+
+    CORS preflight (``OPTIONS``) requests are not counted. Redis errors
+    fail open: the request is served and a warning logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Redis | None = None,
+        limit: int | None = None,
+        window_seconds: int | None = None,
+        local_fraction: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.app = app
+        self._redis = redis or Redis.from_url(settings.redis_url)
+        self._limit = settings.rate_limit_requests if limit is None else limit
+        self._window_seconds = window_seconds or settings.rate_limit_window_seconds
+        # Script object caches the SHA and uses EVALSHA after first load
+        self._script = self._redis.register_script(_SLIDING_WINDOW_LUA)
+
+        if local_fraction is None:
+            local_fraction = settings.rate_limit_local_fraction
+        self._local_capacity = self._limit * local_fraction
+        self._local_rate = self._local_capacity / self._window_seconds
+        # key -> (tokens, last_refill); idle buckets age out after a window
+        self._local: TTLCache[str, tuple[float, float]] = TTLCache(
+            maxsize=10_000, ttl=self._window_seconds
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check the caller's window, then call the app or return 429."""
+        if scope["type"] != "http" or scope.get("method") == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        key = self._key(scope)
+        if self._take_local(key):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            allowed, remaining, retry_after = await self._hit(key)
+        except RedisError:
+            logger.warning("Rate limiter unavailable; allowing request", exc_info=True)
+            await self.app(scope, receive, send)
+            return
+
+        if not allowed:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"},
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self._limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _take_local(self, key: str) -> bool:
+        """Take one token from the in-process bucket for ``key``.
+
+        The check-and-decrement has no await, so it is atomic with
+        respect to other requests on the same event loop.
+
+        Returns:
+            True if the request may skip the Redis check.
+        """
+        if self._local_capacity < 1:
+            return False
+        now = time.monotonic()
+        tokens, last = self._local.get(key, (self._local_capacity, now))
+        tokens = min(self._local_capacity, tokens + (now - last) * self._local_rate)
+        if tokens >= 1:
+            self._local[key] = (tokens - 1, now)
+            return True
+        self._local[key] = (tokens, now)
+        return False
+
+    async def _hit(self, key: str) -> tuple[bool, int, int]:
+        """Record one request against ``key`` in a single EVAL.
+
+        Returns:
+            Tuple of (allowed, remaining, retry_after_seconds).
+        """
+        now_ms = int(time.time() * 1000)
+        window_ms = self._window_seconds * 1000
+        allowed, remaining, oldest_ms = await self._script(
+            keys=[key],
+            args=[
+                now_ms - window_ms,
+                self._limit,
+                now_ms,
+                self._window_seconds,
+                f"{now_ms}-{uuid.uuid4().hex[:8]}",
+            ],
+        )
+        retry_after = 0
+        if not allowed:
+            retry_after = max(1, -(-(int(oldest_ms) + window_ms - now_ms) // 1000))
+        return bool(allowed), int(remaining), retry_after
+
+    @staticmethod
+    def _key(scope: Scope) -> str:
+        """Build the rate limit key for the current request."""
+        payload = scope.get("state", {}).get("jwt_payload")
+        if payload:
+            tenant_id = payload.get("tenant_id", "")
+            user_id = payload.get("sub", "")
+        else:
+            client = scope.get("client")
+            tenant_id, user_id = "anon", client[0] if client else "unknown"
+        # Bucket by the first two path segments, e.g. "/api/resumes"
+        route_bucket = "/".join(scope["path"].split("/")[:3])
+        return f"rl:{tenant_id}:{user_id}:{route_bucket}"
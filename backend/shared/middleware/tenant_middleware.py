@@ -4,4 +4,55 @@ Reads tenant_id from the authenticated request and sets it in the
 TenantContext ContextVar for downstream repository usage.
 """
 
-# TODO(#31): Implement TenantMiddleware setting ContextVar from JWT claims
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from shared.domain.exceptions import AuthenticationError
+from shared.infrastructure.tenant_context import TenantContext
+from shared.middleware.auth_middleware import decode_token_cached
+
+
+class TenantMiddleware:
+    """Pure ASGI middleware that binds the tenant before routing.
+
+    Decodes the bearer token once at the edge, stores the payload on
+    ``request.state.jwt_payload`` for get_current_user() to reuse, and
+    sets TenantContext for the lifetime of the request. Invalid or
+    missing tokens are passed through untouched — rejecting them is
+    the job of the auth dependency on protected routes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Decode the token (if any), bind the tenant, then call the app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = self._extract_bearer_token(scope)
+        if token:
+            try:
+                payload = decode_token_cached(token)
+            except AuthenticationError:
+                pass
+            else:
+                scope.setdefault("state", {})["jwt_payload"] = payload
+                TenantContext.set_current_tenant_id(payload.get("tenant_id", ""))
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            TenantContext.clear()
+
+    @staticmethod
+    def _extract_bearer_token(scope: Scope) -> str | None:
+        """Return the bearer token from the Authorization header, if any."""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, param = get_authorization_scheme_param(value.decode("latin-1"))
+                if scheme.lower() == "bearer" and param:
+                    return param
+                return None
+        return None
@@ -6,27 +6,36 @@ helper objects for unit and integration tests.
 
 # Set test env vars BEFORE any app imports to prevent
 # database.py from connecting to PostgreSQL at module load.
-# Use file-based SQLite so all connections see the same DB.
+# In-memory SQLite; the test engine uses StaticPool so every
+# connection shares the same single DB-API connection. Each process
+# gets its own database, so pytest-xdist workers (-n N) are isolated
+# without per-worker schemas.
+import hashlib
+import hmac
 import os
-import tempfile
+import uuid
 
-with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as _f:
-    _test_db_path = _f.name
-_test_db_url = f"sqlite+aiosqlite:///{_test_db_path}"
+_test_db_url = "sqlite+aiosqlite:///:memory:"
 
 os.environ["DATABASE_URL"] = _test_db_url
 os.environ["APP_ENV"] = "test"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
 
-import asyncio  # noqa: E402
 from collections.abc import AsyncGenerator, Generator  # noqa: E402
+from contextvars import ContextVar  # noqa: E402
+from typing import Any  # noqa: E402
 
 import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
 from httpx import ASGITransport, AsyncClient  # noqa: E402
+from pytest_asyncio import is_async_test  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
 from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncEngine,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool  # noqa: E402
 
 # Import ORM models so they register with Base.metadata
 from billing.infrastructure.models import (  # noqa: E402, F401
@@ -34,23 +43,28 @@ from billing.infrastructure.models import (  # noqa: E402, F401
     UsageRecordModel,
 )
 from config import Settings  # noqa: E402
+from identity.api import routes as auth_routes  # noqa: E402
 from identity.domain.services import PasswordHashingService  # noqa: E402
 from identity.infrastructure.jwt_service import JWTService  # noqa: E402
-from identity.infrastructure.models import TenantModel, UserModel  # noqa: E402, F401
+from identity.infrastructure.models import (  # noqa: E402
+    TenantModel,
+    UserModel,  # noqa: F401
+)
 from resume.infrastructure.models import (  # noqa: E402, F401
     ResumeModel,
     ResumeSectionModel,
 )
 from shared.infrastructure.database import Base, get_async_session  # noqa: E402
+from shared.middleware import auth_middleware  # noqa: E402
 
 
-# --- Event loop fixture (required by pytest-asyncio) ---
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create a session-scoped event loop."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# --- Event loop: run every async test on the session loop ---
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Pin async tests to the session-scoped loop used by the fixtures."""
+    marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(marker, append=False)
 
 
 # --- Test settings ---
@@ -66,54 +80,174 @@ def test_settings() -> Settings:
     )
 
 
-# --- Async database session (file-based SQLite) ---
-@pytest.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create tables in file-based SQLite, yield session."""
-    engine = create_async_engine(_test_db_url, echo=False)
+# --- Async engine (one per test session) ---
+@pytest_asyncio.fixture(scope="session")
+async def _engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the schema once and share the engine across all tests."""
+    engine = create_async_engine(
+        _test_db_url,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself (see SQLAlchemy SQLite dialect docs).
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn: Any, _record: Any) -> None:
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
 
-    # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session_factory = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with session_factory() as session:
-        yield session
+    yield engine
 
     await engine.dispose()
 
 
+# --- Pre-seeded tenants (FK targets for repository tests) ---
+@pytest_asyncio.fixture(scope="session")
+async def seeded_tenants(_engine: AsyncEngine) -> tuple[uuid.UUID, uuid.UUID]:
+    """Insert two tenant rows once per session and return their ids.
+
+    The rows are committed, so they outlive the per-test rollback.
+    Anything a test writes against them is rolled back with db_session,
+    so every test can reuse the same pair.
+    """
+    tenant_ids = (uuid.uuid4(), uuid.uuid4())
+    async with _engine.begin() as conn:
+        await conn.execute(
+            insert(TenantModel),
+            [
+                {
+                    "id": tenant_id,
+                    "name": f"tenant-{tenant_id.hex[:8]}",
+                    "plan": "free",
+                    "status": "active",
+                }
+                for tenant_id in tenant_ids
+            ],
+        )
+    return tenant_ids
+
+
+# --- Async database session (rolled back after each test) ---
+@pytest_asyncio.fixture
+async def db_session(_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session inside an outer transaction that is rolled back.
+
+    ``session.commit()`` only releases a SAVEPOINT, so tests and the
+    app can commit freely without leaking rows into other tests.
+    """
+    async with _engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
+
+
 # --- Test FastAPI app with dependency overrides ---
-@pytest.fixture
-async def test_client(
-    db_session: AsyncSession,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client against the test app."""
-    from main import app
+# The app's DB dependency is overridden once per session; each test only
+# swaps which AsyncSession the override hands out.
+_current_session: ContextVar[AsyncSession] = ContextVar("_current_session")
+
+
+async def _override_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the AsyncSession bound for the running test."""
+    yield _current_session.get()
 
-    # Override the DB session dependency to use the test session
-    async def _override_session() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
+
+@pytest_asyncio.fixture(scope="session")
+async def _client() -> AsyncGenerator[AsyncClient, None]:
+    """Build the ASGI transport and HTTP client once per session."""
+    from main import app
 
     app.dependency_overrides[get_async_session] = _override_session
 
     transport = ASGITransport(app=app)
-    async with AsyncClient(
-        transport=transport,
-        base_url="http://test",
-    ) as client:
-        yield client
+    with pytest.MonkeyPatch.context() as mp:
+        # API tests exercise auth flows, not bcrypt's cost factor
+        mp.setattr(auth_routes, "PasswordHashingService", FastPasswordHasher)
+        async with AsyncClient(
+            transport=transport,
+            base_url="http://test",
+        ) as client:
+            yield client
+
+    app.dependency_overrides.pop(get_async_session, None)
+
+
+@pytest_asyncio.fixture
+async def test_client(
+    _client: AsyncClient,
+    db_session: AsyncSession,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Return the shared HTTP client, routed to this test's session."""
+    token = _current_session.set(db_session)
+    yield _client
+    _current_session.reset(token)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def registered_user(_client: AsyncClient, _engine: AsyncEngine) -> dict[str, str]:
+    """Register one user through the API once per session.
 
-    # Restore original dependencies
-    app.dependency_overrides.clear()
+    The registration is committed outside the per-test rollback, so
+    tests can log in as this user without re-registering. Returns the
+    ``email``, ``password``, ``access_token`` and ``refresh_token``.
+    """
+    credentials = {"email": "registered@example.com", "password": "Password123"}
+    async with AsyncSession(_engine, expire_on_commit=False) as session:
+        token = _current_session.set(session)
+        try:
+            resp = await _client.post(
+                "/api/auth/register",
+                json={**credentials, "tenant_name": "Registered Corp"},
+            )
+        finally:
+            _current_session.reset(token)
+    assert resp.status_code == 201, resp.text
+    tokens = resp.json()
+    return {
+        **credentials,
+        "access_token": tokens["access_token"],
+        "refresh_token": tokens["refresh_token"],
+    }
 
 
 # --- Common helper fixtures ---
+class FastPasswordHasher(PasswordHashingService):
+    """Test-only hasher: one SHA-256 instead of a bcrypt work factor."""
+
+    _PREFIX = "$fake$"
+
+    def hash_password(self, raw_password: str) -> str:
+        """Return a deterministic, cheap stand-in for a bcrypt hash."""
+        return self._PREFIX + hashlib.sha256(raw_password.encode()).hexdigest()
+
+    def verify_password(self, raw_password: str, hashed_password: str) -> bool:
+        """Check ``raw_password`` against a hash from hash_password()."""
+        return hmac.compare_digest(self.hash_password(raw_password), hashed_password)
+
+
+@pytest.fixture(autouse=True)
+def _reset_jwt_service() -> Generator[None, None, None]:
+    """Drop the cached JWTService so settings changes in a test don't leak."""
+    yield
+    auth_middleware._jwt_service.cache_clear()
+
+
 @pytest.fixture
 def jwt_service(test_settings: Settings) -> JWTService:
     """Return a JWTService configured for testing."""
@@ -121,6 +255,12 @@ def jwt_service(test_settings: Settings) -> JWTService:
 
 
 @pytest.fixture
-def password_hasher() -> PasswordHashingService:
-    """Return a PasswordHashingService instance."""
-    return PasswordHashingService()
+def password_hasher(test_settings: Settings) -> PasswordHashingService:
+    """Return the real (bcrypt) PasswordHashingService at test cost."""
+    return PasswordHashingService(rounds=test_settings.bcrypt_rounds)
+
+
+@pytest.fixture
+def fast_password_hasher() -> PasswordHashingService:
+    """Return a cheap hasher for tests that don't check hashing itself."""
+    return FastPasswordHasher()
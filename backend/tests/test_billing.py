@@ -5,15 +5,22 @@ Subscription aggregate root lifecycle, UsageRecord entity, SubscriptionFactory,
 and zero-framework-import verification for the domain layer.
 """
 
-import types
+import ast
+import importlib.util
 import uuid
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
 
 from billing.domain.entities import Subscription, UsageRecord
 from billing.domain.factories import SubscriptionFactory
-from billing.domain.value_objects import Plan, Quota, get_quota_for_plan
+from billing.domain.value_objects import (
+    Plan,
+    Quota,
+    SubscriptionStatus,
+    get_quota_for_plan,
+)
 from shared.domain.exceptions import ValidationError
 
 
@@ -92,6 +99,28 @@ class TestQuota:
         assert quota.max_tokens == 0
 
 
+# ===================================================================
+# Value Object Tests — SubscriptionStatus Enum
+# ===================================================================
+class TestSubscriptionStatus:
+    """Tests for the SubscriptionStatus enum."""
+
+    def test_label_round_trips(self) -> None:
+        """Every status should parse back from its label."""
+        for status in SubscriptionStatus:
+            assert SubscriptionStatus.from_label(status.label) is status
+
+    def test_labels_are_lowercase_names(self) -> None:
+        """Labels should keep the external string contract."""
+        labels = [s.label for s in SubscriptionStatus]
+        assert labels == ["active", "cancelled", "expired"]
+
+    def test_unknown_label_raises(self) -> None:
+        """An unknown label should raise ValidationError."""
+        with pytest.raises(ValidationError):
+            SubscriptionStatus.from_label("paused")
+
+
 # ===================================================================
 # Value Object Tests — Plan-to-Quota Mapping
 # ===================================================================
@@ -154,7 +183,7 @@ class TestSubscription:
         )
         assert sub.tenant_id == tenant_id
         assert sub.plan == Plan.PRO
-        assert sub.status == "active"
+        assert sub.status is SubscriptionStatus.ACTIVE
         assert sub.current_period_start == now
         assert sub.current_period_end == now + timedelta(days=30)
         assert sub.stripe_subscription_id is None
@@ -173,13 +202,13 @@ class TestSubscription:
         """An active subscription should transition to cancelled."""
         sub = self._make_subscription(status="active")
         sub.cancel()
-        assert sub.status == "cancelled"
+        assert sub.status is SubscriptionStatus.CANCELLED
 
     def test_expire_active_subscription(self) -> None:
         """An active subscription should transition to expired."""
         sub = self._make_subscription(status="active")
         sub.expire()
-        assert sub.status == "expired"
+        assert sub.status is SubscriptionStatus.EXPIRED
 
     def test_cancel_already_cancelled_raises(self) -> None:
         """Cancelling an already cancelled subscription should raise."""
@@ -240,6 +269,13 @@ class TestSubscription:
         )
         assert sub.stripe_subscription_id == "sub_abc123"
 
+    def test_subscription_has_no_instance_dict(self) -> None:
+        """Subscription should be fully slotted (no per-instance __dict__)."""
+        sub = self._make_subscription()
+        assert not hasattr(sub, "__dict__")
+        with pytest.raises(AttributeError):
+            sub.unknown = 1  # type: ignore[attr-defined]
+
 
 # ===================================================================
 # Entity Tests — UsageRecord
@@ -272,6 +308,16 @@ class TestUsageRecord:
         )
         assert isinstance(record.id, uuid.UUID)
 
+    def test_usage_record_has_no_instance_dict(self) -> None:
+        """UsageRecord should be fully slotted (no per-instance __dict__)."""
+        record = UsageRecord(
+            tenant_id=uuid.uuid4(),
+            resource_type="tokens",
+            quantity=1,
+            recorded_at=datetime.utcnow(),
+        )
+        assert not hasattr(record, "__dict__")
+
     def test_usage_record_negative_quantity_raises(self) -> None:
         """Negative quantity should raise ValidationError."""
         with pytest.raises(ValidationError):
@@ -319,7 +365,18 @@ class TestSubscriptionFactory:
         assert isinstance(sub, Subscription)
         assert sub.tenant_id == tenant_id
         assert sub.plan == Plan.FREE
-        assert sub.status == "active"
+        assert sub.status is SubscriptionStatus.ACTIVE
+
+    def test_create_subscription_uses_given_now(self) -> None:
+        """An explicit `now` should anchor the billing period."""
+        now = datetime(2025, 1, 1, 12, 0)
+        sub = SubscriptionFactory.create_subscription(
+            tenant_id=uuid.uuid4(),
+            plan=Plan.FREE,
+            now=now,
+        )
+        assert sub.current_period_start == now
+        assert sub.current_period_end == now + timedelta(days=30)
 
     def test_create_pro_subscription(self) -> None:
         """Factory should create a PRO plan subscription."""
@@ -329,7 +386,7 @@ class TestSubscriptionFactory:
             plan=Plan.PRO,
         )
         assert sub.plan == Plan.PRO
-        assert sub.status == "active"
+        assert sub.status is SubscriptionStatus.ACTIVE
 
     def test_create_enterprise_subscription(self) -> None:
         """Factory should create an ENTERPRISE plan subscription."""
@@ -339,7 +396,7 @@ class TestSubscriptionFactory:
             plan=Plan.ENTERPRISE,
         )
         assert sub.plan == Plan.ENTERPRISE
-        assert sub.status == "active"
+        assert sub.status is SubscriptionStatus.ACTIVE
 
     def test_factory_sets_period_dates(self) -> None:
         """Factory should set current_period_start and current_period_end."""
@@ -370,53 +427,63 @@ class TestSubscriptionFactory:
 class TestDomainLayerPurity:
     """Verify that billing domain layer has zero external framework imports."""
 
-    def test_no_sqlalchemy_in_value_objects(self) -> None:
+    def test_no_sqlalchemy_in_value_objects(
+        self, domain_imports: dict[str, set[str]]
+    ) -> None:
         """value_objects.py should not import SQLAlchemy."""
-        import billing.domain.value_objects as mod
-
-        source = _get_module_source(mod)
-        assert "sqlalchemy" not in source.lower()
+        assert "sqlalchemy" not in domain_imports["billing.domain.value_objects"]
 
-    def test_no_sqlalchemy_in_entities(self) -> None:
+    def test_no_sqlalchemy_in_entities(
+        self, domain_imports: dict[str, set[str]]
+    ) -> None:
         """entities.py should not import SQLAlchemy."""
-        import billing.domain.entities as mod
-
-        source = _get_module_source(mod)
-        assert "sqlalchemy" not in source.lower()
+        assert "sqlalchemy" not in domain_imports["billing.domain.entities"]
 
-    def test_no_sqlalchemy_in_factories(self) -> None:
+    def test_no_sqlalchemy_in_factories(
+        self, domain_imports: dict[str, set[str]]
+    ) -> None:
         """factories.py should not import SQLAlchemy."""
-        import billing.domain.factories as mod
-
-        source = _get_module_source(mod)
-        assert "sqlalchemy" not in source.lower()
+        assert "sqlalchemy" not in domain_imports["billing.domain.factories"]
 
-    def test_no_fastapi_in_domain(self) -> None:
+    def test_no_fastapi_in_domain(self, domain_imports: dict[str, set[str]]) -> None:
         """Domain layer should not import FastAPI."""
-        import billing.domain.entities as entities_mod
-        import billing.domain.factories as factories_mod
-        import billing.domain.value_objects as vo_mod
-
-        for mod in [vo_mod, entities_mod, factories_mod]:
-            source = _get_module_source(mod)
-            assert "fastapi" not in source.lower()
+        for imports in domain_imports.values():
+            assert "fastapi" not in imports
 
-    def test_no_pydantic_in_domain(self) -> None:
+    def test_no_pydantic_in_domain(self, domain_imports: dict[str, set[str]]) -> None:
         """Domain layer should not import Pydantic (use dataclasses)."""
-        import billing.domain.entities as entities_mod
-        import billing.domain.factories as factories_mod
-        import billing.domain.value_objects as vo_mod
-
-        for mod in [vo_mod, entities_mod, factories_mod]:
-            source = _get_module_source(mod)
-            assert "pydantic" not in source.lower()
-
-
-def _get_module_source(module: types.ModuleType) -> str:
-    """Read the source code of a Python module file."""
-    import inspect
-
-    return inspect.getsource(module)
+        for imports in domain_imports.values():
+            assert "pydantic" not in imports
+
+
+_DOMAIN_MODULES = (
+    "billing.domain.value_objects",
+    "billing.domain.entities",
+    "billing.domain.factories",
+    "billing.domain.services",
+)
+
+
+@pytest.fixture(scope="session")
+def domain_imports() -> dict[str, set[str]]:
+    """Map each billing domain module to the top-level packages it imports.
+
+    Parsed from the AST once per session, so names that only appear in
+    comments or docstrings don't count.
+    """
+    out: dict[str, set[str]] = {}
+    for name in _DOMAIN_MODULES:
+        spec = importlib.util.find_spec(name)
+        assert spec is not None and spec.origin is not None
+        tree = ast.parse(Path(spec.origin).read_text())
+        roots: set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                roots.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                roots.add(node.module.split(".")[0])
+        out[name] = roots
+    return out
 
 
 # ===================================================================
@@ -496,10 +563,10 @@ class TestQuotaEnforcementService:
         with pytest.raises(ValidationError):
             svc.check_token_quota(sub, current_usage=0)
 
-    def test_no_framework_imports_in_services(self) -> None:
+    def test_no_framework_imports_in_services(
+        self, domain_imports: dict[str, set[str]]
+    ) -> None:
         """services.py should not import SQLAlchemy or FastAPI."""
-        import billing.domain.services as mod
-
-        source = _get_module_source(mod)
-        assert "sqlalchemy" not in source.lower()
-        assert "fastapi" not in source.lower()
+        imports = domain_imports["billing.domain.services"]
+        assert "sqlalchemy" not in imports
+        assert "fastapi" not in imports
@@ -12,30 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from billing.domain.entities import Subscription, UsageRecord
 from billing.domain.factories import SubscriptionFactory
-from billing.domain.value_objects import Plan
+from billing.domain.value_objects import Plan, SubscriptionStatus
 from billing.infrastructure.repository_impl import (
     SubscriptionRepository,
     UsageRepository,
 )
-from identity.infrastructure.models import TenantModel
 
-# --- helpers ---
-
-
-async def _seed_tenant(session: AsyncSession, tenant_id: uuid.UUID) -> None:
-    """Insert a minimal tenant row so FK constraints are satisfied.
-
-    Uses merge to avoid duplicate-key errors when the same tenant
-    is seeded across multiple tests sharing a file-based SQLite DB.
-    """
-    model = TenantModel(
-        id=tenant_id,
-        name=f"tenant-{tenant_id.hex[:8]}",
-        plan="free",
-        status="active",
-    )
-    await session.merge(model)
-    await session.flush()
+# One fixed timestamp for every record; bounds bracket it by a day.
+_NOW = datetime(2025, 6, 15, 12, 0)
+_PERIOD_START = _NOW - timedelta(days=1)
+_PERIOD_END = _NOW + timedelta(days=1)
 
 
 # ===================================================================
@@ -45,29 +31,30 @@ class TestSubscriptionRepository:
     """Integration tests for SubscriptionRepository."""
 
     @pytest.mark.asyncio
-    async def test_save_and_find_by_tenant(self, db_session: AsyncSession) -> None:
+    async def test_save_and_find_by_tenant(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
         """Should persist and retrieve subscriptions for a tenant."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = SubscriptionRepository(db_session)
         sub = SubscriptionFactory.create_subscription(
             tenant_id=tenant_id, plan=Plan.PRO
         )
         await repo.save(sub)
-        await db_session.commit()
 
         results = await repo.find_by_tenant_id(tenant_id)
         assert len(results) == 1
         assert results[0].tenant_id == tenant_id
         assert results[0].plan == Plan.PRO
-        assert results[0].status == "active"
+        assert results[0].status is SubscriptionStatus.ACTIVE
 
     @pytest.mark.asyncio
-    async def test_find_active_by_tenant(self, db_session: AsyncSession) -> None:
+    async def test_find_active_by_tenant(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
         """Should return only the active subscription."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = SubscriptionRepository(db_session)
 
@@ -76,28 +63,25 @@ class TestSubscriptionRepository:
         )
         await repo.save(active)
 
-        now = datetime.utcnow()
         cancelled = Subscription(
             tenant_id=tenant_id,
             plan=Plan.FREE,
             status="cancelled",
-            current_period_start=now - timedelta(days=60),
-            current_period_end=now - timedelta(days=30),
+            current_period_start=_NOW - timedelta(days=60),
+            current_period_end=_NOW - timedelta(days=30),
         )
         await repo.save(cancelled)
-        await db_session.commit()
 
         result = await repo.find_active_by_tenant_id(tenant_id)
         assert result is not None
-        assert result.status == "active"
+        assert result.status is SubscriptionStatus.ACTIVE
 
     @pytest.mark.asyncio
     async def test_find_active_returns_none_when_absent(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
     ) -> None:
         """Should return None when no active subscription exists."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = SubscriptionRepository(db_session)
         result = await repo.find_active_by_tenant_id(tenant_id)
@@ -111,85 +95,139 @@ class TestUsageRepository:
     """Integration tests for UsageRepository."""
 
     @pytest.mark.asyncio
-    async def test_save_and_find_by_period(self, db_session: AsyncSession) -> None:
+    async def test_save_and_find_by_period(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
         """Should persist and retrieve usage records by period."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = UsageRepository(db_session)
-        now = datetime.utcnow()
         record = UsageRecord(
             tenant_id=tenant_id,
             resource_type="optimization",
             quantity=1,
-            recorded_at=now,
+            recorded_at=_NOW,
         )
         await repo.save(record)
-        await db_session.commit()
 
         results = await repo.find_by_tenant_and_period(
             tenant_id=tenant_id,
-            period_start=now - timedelta(days=1),
-            period_end=now + timedelta(days=1),
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
         )
         assert len(results) == 1
         assert results[0].resource_type == "optimization"
         assert results[0].quantity == 1
 
     @pytest.mark.asyncio
-    async def test_get_usage_summary(self, db_session: AsyncSession) -> None:
+    async def test_save_many_inserts_all_records(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
+        """save_many should persist every record in the batch."""
+        tenant_id, _ = seeded_tenants
+
+        repo = UsageRepository(db_session)
+        records = [
+            UsageRecord(
+                tenant_id=tenant_id,
+                resource_type="tokens",
+                quantity=100 * (i + 1),
+                recorded_at=_NOW,
+            )
+            for i in range(3)
+        ]
+        await repo.save_many(records)
+        await repo.save_many([])
+
+        results = await repo.find_by_tenant_and_period(
+            tenant_id=tenant_id,
+            period_start=_PERIOD_START,
+            period_end=_PERIOD_END,
+        )
+        assert {r.id for r in results} == {r.id for r in records}
+        assert sum(r.quantity for r in results) == 600
+
+    @pytest.mark.asyncio
+    async def test_get_usage_summary(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
         """Should sum quantities for a resource type in a period."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = UsageRepository(db_session)
-        now = datetime.utcnow()
-        period_start = now - timedelta(days=1)
-        period_end = now + timedelta(days=1)
 
-        for _ in range(3):
-            r = UsageRecord(
+        records = [
+            UsageRecord(
                 tenant_id=tenant_id,
                 resource_type="optimization",
                 quantity=1,
-                recorded_at=now,
+                recorded_at=_NOW,
+            )
+            for _ in range(3)
+        ]
+        records.append(
+            UsageRecord(
+                tenant_id=tenant_id,
+                resource_type="tokens",
+                quantity=5000,
+                recorded_at=_NOW,
             )
-            await repo.save(r)
-
-        token_record = UsageRecord(
-            tenant_id=tenant_id,
-            resource_type="tokens",
-            quantity=5000,
-            recorded_at=now,
         )
-        await repo.save(token_record)
-        await db_session.commit()
+        await repo.save_many(records)
 
         opt_total = await repo.get_usage_summary(
-            tenant_id, "optimization", period_start, period_end
+            tenant_id, "optimization", _PERIOD_START, _PERIOD_END
         )
         assert opt_total == 3
 
         tok_total = await repo.get_usage_summary(
-            tenant_id, "tokens", period_start, period_end
+            tenant_id, "tokens", _PERIOD_START, _PERIOD_END
         )
         assert tok_total == 5000
 
+    @pytest.mark.asyncio
+    async def test_get_usage_summary_respects_period_bounds(
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
+    ) -> None:
+        """Only records in [period_start, period_end) should be summed."""
+        tenant_id, _ = seeded_tenants
+
+        repo = UsageRepository(db_session)
+        await repo.save_many(
+            [
+                UsageRecord(
+                    tenant_id=tenant_id,
+                    resource_type="tokens",
+                    quantity=qty,
+                    recorded_at=at,
+                )
+                for qty, at in (
+                    (1, _PERIOD_START - timedelta(seconds=1)),
+                    (10, _PERIOD_START),
+                    (100, _PERIOD_END - timedelta(seconds=1)),
+                    (1000, _PERIOD_END),
+                )
+            ]
+        )
+
+        total = await repo.get_usage_summary(
+            tenant_id, "tokens", _PERIOD_START, _PERIOD_END
+        )
+        assert total == 110
+
     @pytest.mark.asyncio
     async def test_get_usage_summary_returns_zero_when_empty(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
     ) -> None:
         """Should return 0 when no records exist for the period."""
-        tenant_id = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_id)
+        tenant_id, _ = seeded_tenants
 
         repo = UsageRepository(db_session)
-        now = datetime.utcnow()
         total = await repo.get_usage_summary(
             tenant_id,
             "optimization",
-            now - timedelta(days=1),
-            now + timedelta(days=1),
+            _PERIOD_START,
+            _PERIOD_END,
         )
         assert total == 0
 
@@ -203,13 +241,10 @@ class TestTenantIsolation:
     @pytest.mark.asyncio
     @pytest.mark.tenant_isolation
     async def test_tenant_a_cannot_see_tenant_b_subscriptions(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
     ) -> None:
         """Tenant A's subscriptions must be invisible to Tenant B."""
-        tenant_a = uuid.uuid4()
-        tenant_b = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_a)
-        await _seed_tenant(db_session, tenant_b)
+        tenant_a, tenant_b = seeded_tenants
 
         repo = SubscriptionRepository(db_session)
 
@@ -217,7 +252,6 @@ class TestTenantIsolation:
             tenant_id=tenant_a, plan=Plan.ENTERPRISE
         )
         await repo.save(sub_a)
-        await db_session.commit()
 
         result_b = await repo.find_by_tenant_id(tenant_b)
         assert len(result_b) == 0
@@ -228,30 +262,25 @@ class TestTenantIsolation:
     @pytest.mark.asyncio
     @pytest.mark.tenant_isolation
     async def test_tenant_a_cannot_see_tenant_b_usage(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, seeded_tenants: tuple[uuid.UUID, uuid.UUID]
     ) -> None:
         """Tenant A's usage records must be invisible to Tenant B."""
-        tenant_a = uuid.uuid4()
-        tenant_b = uuid.uuid4()
-        await _seed_tenant(db_session, tenant_a)
-        await _seed_tenant(db_session, tenant_b)
+        tenant_a, tenant_b = seeded_tenants
 
         repo = UsageRepository(db_session)
-        now = datetime.utcnow()
 
         record = UsageRecord(
             tenant_id=tenant_a,
             resource_type="optimization",
             quantity=1,
-            recorded_at=now,
+            recorded_at=_NOW,
         )
         await repo.save(record)
-        await db_session.commit()
 
         total_b = await repo.get_usage_summary(
             tenant_b,
             "optimization",
-            now - timedelta(days=1),
-            now + timedelta(days=1),
+            _PERIOD_START,
+            _PERIOD_END,
         )
         assert total_b == 0
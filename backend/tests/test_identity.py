@@ -4,14 +4,22 @@ Covers: value object validation, password hashing, tenant factory,
 API registration, login, token refresh, and /me endpoint.
 """
 
+import uuid
+from unittest.mock import patch
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import get_settings
 from identity.domain.entities import Tenant, User
 from identity.domain.factories import TenantFactory
 from identity.domain.services import PasswordHashingService
 from identity.domain.value_objects import Email, Role
-from shared.domain.exceptions import ValidationError
+from identity.infrastructure.jwt_service import JWTService
+from identity.infrastructure.models import UserModel
+from shared.domain.exceptions import AuthenticationError, ValidationError
+from shared.middleware import auth_middleware
 
 
 # ===================================================================
@@ -35,6 +43,12 @@ class TestEmail:
         email = Email("  TOM@EXAMPLE.COM  ")
         assert email.value == "tom@example.com"
 
+    def test_invalid_email_raises_on_every_attempt(self) -> None:
+        """Memoized validation must not cache a failure as a success."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                Email("still-not-an-email")
+
 
 class TestPasswordHashing:
     """Tests for PasswordHashingService."""
@@ -49,17 +63,24 @@ class TestPasswordHashing:
         hashed = password_hasher.hash_password("Secret123")
         assert not password_hasher.verify_password("WrongPass", hashed)
 
+    def test_rounds_set_work_factor_of_new_hashes(self) -> None:
+        """New hashes use the configured cost; older costs still verify."""
+        cheap = PasswordHashingService(rounds=4)
+        hashed = cheap.hash_password("Secret123")
+        assert hashed.startswith("$2b$04$")
+        assert PasswordHashingService(rounds=5).verify_password("Secret123", hashed)
+
 
 class TestTenantFactory:
     """Tests for TenantFactory.create_tenant_with_admin."""
 
-    def test_creates_admin(self, password_hasher: PasswordHashingService) -> None:
+    def test_creates_admin(self, fast_password_hasher: PasswordHashingService) -> None:
         """Factory should create tenant + admin user."""
         tenant, user = TenantFactory.create_tenant_with_admin(
             name="Test Corp",
             admin_email="admin@test.com",
             admin_password="Pass1234",
-            hasher=password_hasher,
+            hasher=fast_password_hasher,
         )
         assert isinstance(tenant, Tenant)
         assert isinstance(user, User)
@@ -68,14 +89,14 @@ class TestTenantFactory:
         assert user.tenant_id == tenant.id
 
     def test_duplicate_email_raises(
-        self, password_hasher: PasswordHashingService
+        self, fast_password_hasher: PasswordHashingService
     ) -> None:
         """Adding a user with duplicate email should raise."""
         tenant, _ = TenantFactory.create_tenant_with_admin(
             name="Test Corp",
             admin_email="admin@test.com",
             admin_password="Pass1234",
-            hasher=password_hasher,
+            hasher=fast_password_hasher,
         )
         # Try adding another user with the same email
         dup_user = User(
@@ -88,6 +109,53 @@ class TestTenantFactory:
             tenant.add_user(dup_user)
 
 
+# ===================================================================
+# Auth Middleware Tests
+# ===================================================================
+class TestAuthMiddleware:
+    """Tests for JWT decoding in the auth middleware."""
+
+    def test_decode_token_cached_reuses_payload(self) -> None:
+        """A repeated token should be served from the payload cache."""
+        token = JWTService(get_settings()).create_access_token(
+            user_id=str(uuid.uuid4()),
+            tenant_id=str(uuid.uuid4()),
+            role="member",
+        )
+        first = auth_middleware.decode_token_cached(token)
+        second = auth_middleware.decode_token_cached(token)
+        assert first is second
+        assert token not in auth_middleware._payload_cache
+
+    def test_decode_token_cached_rejects_invalid_token(self) -> None:
+        """An invalid token should raise and not be cached."""
+        size_before = len(auth_middleware._payload_cache)
+        with pytest.raises(AuthenticationError):
+            auth_middleware.decode_token_cached("not.a.jwt")
+        assert len(auth_middleware._payload_cache) == size_before
+
+    def test_decode_token_cached_rejects_malformed_token_before_decode(self) -> None:
+        """Tokens without three segments should fail without a decode call."""
+        with patch.object(auth_middleware, "_jwt_service") as factory:
+            with pytest.raises(AuthenticationError, match="Malformed"):
+                auth_middleware.decode_token_cached("garbage")
+            with pytest.raises(AuthenticationError, match="Malformed"):
+                auth_middleware.decode_token_cached("a.b.c" + "x" * 8192)
+        factory.assert_not_called()
+
+    def test_decode_token_cached_remembers_rejected_token(self) -> None:
+        """A token that failed once should be rejected again from cache."""
+        token = "bad.token.signature"
+        with pytest.raises(AuthenticationError):
+            auth_middleware.decode_token_cached(token)
+        with (
+            patch.object(auth_middleware, "_jwt_service") as factory,
+            pytest.raises(AuthenticationError, match="Invalid token"),
+        ):
+            auth_middleware.decode_token_cached(token)
+        factory.assert_not_called()
+
+
 # ===================================================================
 # API Integration Tests
 # ===================================================================
@@ -112,23 +180,15 @@ class TestAuthAPI:
         assert data["token_type"] == "bearer"
 
     @pytest.mark.asyncio
-    async def test_login_returns_token(self, test_client: AsyncClient) -> None:
-        """Register then login should return tokens."""
-        # Register first
-        await test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "login@example.com",
-                "password": "Password123",
-                "tenant_name": "Login Corp",
-            },
-        )
-        # Login
+    async def test_login_returns_token(
+        self, test_client: AsyncClient, registered_user: dict[str, str]
+    ) -> None:
+        """Login as a registered user should return tokens."""
         resp = await test_client.post(
             "/api/auth/login",
             json={
-                "email": "login@example.com",
-                "password": "Password123",
+                "email": registered_user["email"],
+                "password": registered_user["password"],
             },
         )
         assert resp.status_code == 200
@@ -136,48 +196,31 @@ class TestAuthAPI:
         assert "access_token" in data
 
     @pytest.mark.asyncio
-    async def test_login_wrong_password_401(self, test_client: AsyncClient) -> None:
+    async def test_login_wrong_password_401(
+        self, test_client: AsyncClient, registered_user: dict[str, str]
+    ) -> None:
         """Login with wrong password should return 401."""
-        # Register
-        await test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "wrong@example.com",
-                "password": "Password123",
-                "tenant_name": "Wrong Corp",
-            },
-        )
-        # Login with wrong password
         resp = await test_client.post(
             "/api/auth/login",
             json={
-                "email": "wrong@example.com",
+                "email": registered_user["email"],
                 "password": "BadPassword",
             },
         )
         assert resp.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_me_with_token_200(self, test_client: AsyncClient) -> None:
+    async def test_me_with_token_200(
+        self, test_client: AsyncClient, registered_user: dict[str, str]
+    ) -> None:
         """GET /api/auth/me with valid token returns user."""
-        # Register to get token
-        reg = await test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "me@example.com",
-                "password": "Password123",
-                "tenant_name": "Me Corp",
-            },
-        )
-        token = reg.json()["access_token"]
-        # Call /me
         resp = await test_client.get(
             "/api/auth/me",
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {registered_user['access_token']}"},
         )
         assert resp.status_code == 200
         data = resp.json()
-        assert data["email"] == "me@example.com"
+        assert data["email"] == registered_user["email"]
 
     @pytest.mark.asyncio
     async def test_me_without_token_401(self, test_client: AsyncClient) -> None:
@@ -186,25 +229,40 @@ class TestAuthAPI:
         assert resp.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_refresh_returns_new_token(self, test_client: AsyncClient) -> None:
+    async def test_refresh_returns_new_token(
+        self, test_client: AsyncClient, registered_user: dict[str, str]
+    ) -> None:
         """POST /api/auth/refresh returns new access token."""
-        # Register
-        reg = await test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "refresh@example.com",
-                "password": "Password123",
-                "tenant_name": "Refresh Corp",
-            },
-        )
-        refresh_token = reg.json()["refresh_token"]
-        # Refresh
         resp = await test_client.post(
             "/api/auth/refresh",
-            json={"refresh_token": refresh_token},
+            json={"refresh_token": registered_user["refresh_token"]},
         )
         assert resp.status_code == 200
         data = resp.json()
         assert "access_token" in data
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
+
+    @pytest.mark.asyncio
+    async def test_me_rejects_deleted_user_immediately(
+        self, test_client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """A user removed after login must not stay authorized."""
+        resp = await test_client.post(
+            "/api/auth/register",
+            json={
+                "email": "deleted@example.com",
+                "password": "Password123",
+                "tenant_name": "Deleted Corp",
+            },
+        )
+        headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+        me = await test_client.get("/api/auth/me", headers=headers)
+        assert me.status_code == 200
+
+        user = await db_session.get(UserModel, uuid.UUID(me.json()["id"]))
+        await db_session.delete(user)
+        await db_session.flush()
+
+        resp = await test_client.get("/api/auth/me", headers=headers)
+        assert resp.status_code == 401
@@ -15,8 +15,11 @@ Covers:
     - A5 ResumeRewriterAgent and resume_rewriter_node
 """
 
+import json
+import math
+import re
 import uuid
-from typing import Any
+from typing import Any, NoReturn, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -31,7 +34,27 @@ from optimization.domain.value_objects import (
     ScoreBreakdown,
     SessionStatus,
 )
-from optimization.infrastructure.agents.graph import JDAnalysisDict
+from optimization.infrastructure.agents import rag_retriever as rag_mod
+from optimization.infrastructure.agents.base_agent import BaseAgent
+from optimization.infrastructure.agents.graph import (
+    JDAnalysisDict,
+    OptimizationState,
+    result_aggregator_node,
+    score_check_router,
+)
+from optimization.infrastructure.agents.jd_analyzer import (
+    JDAnalyzerAgent,
+    jd_analyzer_node,
+)
+from optimization.infrastructure.agents.rag_retriever import (
+    RAGRetrieverAgent,
+    _build_query_from_jd,
+    rag_retriever_node,
+)
+from optimization.infrastructure.agents.resume_rewriter import (
+    ResumeRewriterAgent,
+    resume_rewriter_node,
+)
 from shared.domain.exceptions import AgentExecutionError, ValidationError
 
 # ---------------------------------------------------------------------------
@@ -42,6 +65,7 @@ TENANT_A_ID = uuid.uuid4()
 TENANT_B_ID = uuid.uuid4()
 USER_ID = uuid.uuid4()
 RESUME_ID = uuid.uuid4()
+SESSION_ID = uuid.uuid4()
 SAMPLE_JD = (
     "We are looking for a Python backend engineer with 5+ years of "
     "experience in AWS, Docker, and microservices architecture."
@@ -63,12 +87,38 @@ def _make_session(
     )
 
 
+# Value objects are frozen, so the default instances are built once and
+# shared; only non-default variants are constructed per call.
+_DEFAULT_BREAKDOWN = ScoreBreakdown(
+    keywords=0.85, skills=0.80, experience=0.75, formatting=0.90
+)
+_DEFAULT_JD_ANALYSIS = JDAnalysis(
+    hard_skills=("Python", "AWS", "Docker"),
+    soft_skills=("leadership", "communication"),
+    responsibilities=("Design microservices", "Lead code reviews"),
+    qualifications=("5+ years backend", "BS Computer Science"),
+    keyword_weights=(("Python", 0.95), ("AWS", 0.85), ("Docker", 0.70)),
+)
+_DEFAULT_GAP_REPORT = GapReport(
+    missing_skills=("Kubernetes", "Terraform"),
+    recommendations=(
+        "Add Kubernetes experience from side projects",
+        "Highlight infrastructure-as-code experience",
+    ),
+    transferable_skills=("Docker", "AWS CloudFormation"),
+    priority=(("Kubernetes", "high"), ("Terraform", "medium")),
+)
+
+
 def _make_breakdown(
     keywords: float = 0.85,
     skills: float = 0.80,
     experience: float = 0.75,
     formatting: float = 0.90,
 ) -> ScoreBreakdown:
+    candidate = (keywords, skills, experience, formatting)
+    if candidate == (0.85, 0.80, 0.75, 0.90):
+        return _DEFAULT_BREAKDOWN
     return ScoreBreakdown(
         keywords=keywords,
         skills=skills,
@@ -78,25 +128,11 @@ def _make_breakdown(
 
 
 def _make_jd_analysis() -> JDAnalysis:
-    return JDAnalysis(
-        hard_skills=("Python", "AWS", "Docker"),
-        soft_skills=("leadership", "communication"),
-        responsibilities=("Design microservices", "Lead code reviews"),
-        qualifications=("5+ years backend", "BS Computer Science"),
-        keyword_weights=(("Python", 0.95), ("AWS", 0.85), ("Docker", 0.70)),
-    )
+    return _DEFAULT_JD_ANALYSIS
 
 
 def _make_gap_report() -> GapReport:
-    return GapReport(
-        missing_skills=("Kubernetes", "Terraform"),
-        recommendations=(
-            "Add Kubernetes experience from side projects",
-            "Highlight infrastructure-as-code experience",
-        ),
-        transferable_skills=("Docker", "AWS CloudFormation"),
-        priority=(("Kubernetes", "high"), ("Terraform", "medium")),
-    )
+    return _DEFAULT_GAP_REPORT
 
 
 def _make_result(session_id: uuid.UUID) -> OptimizationResult:
@@ -151,6 +187,11 @@ class TestSessionStatus:
         for target in SessionStatus:
             assert not SessionStatus.FAILED.can_transition_to(target)
 
+    def test_every_status_has_transition_entry(self) -> None:
+        for status in SessionStatus:
+            for target in SessionStatus:
+                assert isinstance(status.can_transition_to(target), bool)
+
 
 # ===================================================================
 # ScoreBreakdown
@@ -179,6 +220,16 @@ class TestScoreBreakdown:
         expected = 0.8 * 0.35 + 0.6 * 0.30 + 0.4 * 0.25 + 1.0 * 0.10
         assert bd.weighted_overall() == pytest.approx(expected)
 
+    def test_batch_weighted_matches_scalar(self) -> None:
+        breakdowns = [
+            _make_breakdown(),
+            ScoreBreakdown(keywords=0.8, skills=0.6, experience=0.4, formatting=1.0),
+            ScoreBreakdown(keywords=0.0, skills=0.0, experience=0.0, formatting=0.0),
+        ]
+        assert ScoreBreakdown.batch_weighted(breakdowns) == [
+            bd.weighted_overall() for bd in breakdowns
+        ]
+
     def test_score_below_zero_raises(self) -> None:
         with pytest.raises(ValidationError, match="between 0.0 and 1.0"):
             ScoreBreakdown(keywords=-0.1, skills=0.8, experience=0.7, formatting=0.9)
@@ -391,14 +442,13 @@ class TestOptimizationResult:
     """Tests for OptimizationResult entity."""
 
     def test_create_result(self) -> None:
-        sid = uuid.uuid4()
-        result = _make_result(sid)
-        assert result.session_id == sid
+        result = _make_result(SESSION_ID)
+        assert result.session_id == SESSION_ID
         assert result.total_tokens_used == 4500
         assert "experience" in result.optimized_sections
 
     def test_default_empty_sections(self) -> None:
-        result = OptimizationResult(session_id=uuid.uuid4(), tenant_id=TENANT_A_ID)
+        result = OptimizationResult(session_id=SESSION_ID, tenant_id=TENANT_A_ID)
         assert result.optimized_sections == {}
         assert result.total_tokens_used == 0
 
@@ -448,18 +498,23 @@ class TestOptimizationSessionFactory:
 # ===================================================================
 
 
+_UNEVEN_BREAKDOWN = ScoreBreakdown(
+    keywords=0.8, skills=0.6, experience=0.4, formatting=1.0
+)
+_UNEVEN_EXPECTED_OVERALL = round(0.8 * 0.35 + 0.6 * 0.30 + 0.4 * 0.25 + 1.0 * 0.10, 4)
+
+
 class TestOptimizationDomainService:
     """Tests for domain service scoring and retry logic."""
 
-    def test_validate_score_valid(self) -> None:
-        for val in (0.0, 0.5, 1.0):
-            OptimizationDomainService.validate_score(val)
+    @pytest.mark.parametrize("val", [0.0, 0.5, 1.0])
+    def test_validate_score_valid(self, val: float) -> None:
+        OptimizationDomainService.validate_score(val)
 
-    def test_validate_score_out_of_range(self) -> None:
+    @pytest.mark.parametrize("val", [1.5, -0.1])
+    def test_validate_score_out_of_range(self, val: float) -> None:
         with pytest.raises(ValidationError):
-            OptimizationDomainService.validate_score(1.5)
-        with pytest.raises(ValidationError):
-            OptimizationDomainService.validate_score(-0.1)
+            OptimizationDomainService.validate_score(val)
 
     def test_validate_status_transition_valid(self) -> None:
         OptimizationDomainService.validate_status_transition(
@@ -475,10 +530,10 @@ class TestOptimizationDomainService:
             )
 
     def test_calculate_overall_score(self) -> None:
-        bd = ScoreBreakdown(keywords=0.8, skills=0.6, experience=0.4, formatting=1.0)
-        expected = round(0.8 * 0.35 + 0.6 * 0.30 + 0.4 * 0.25 + 1.0 * 0.10, 4)
-        result = OptimizationDomainService.calculate_overall_score(bd)
-        assert result == pytest.approx(expected)
+        result = OptimizationDomainService.calculate_overall_score(_UNEVEN_BREAKDOWN)
+        assert math.isclose(
+            result, _UNEVEN_EXPECTED_OVERALL, rel_tol=1e-9, abs_tol=1e-12
+        )
 
     def test_create_ats_score(self) -> None:
         bd = _make_breakdown()
@@ -540,20 +595,24 @@ class TestAgentExecutionError:
 # ===================================================================
 
 
+# Built once for the read-only tenant checks below; entities are
+# mutable, so tests that change state keep calling _make_session().
+_SESSION_A = _make_session(tenant_id=TENANT_A_ID)
+_SESSION_B = _make_session(tenant_id=TENANT_B_ID)
+
+
 class TestTenantIsolation:
     """Verify tenant_id is set on domain entities at creation time."""
 
     def test_session_carries_tenant_id(self) -> None:
-        assert _make_session(tenant_id=TENANT_A_ID).tenant_id == TENANT_A_ID
+        assert _SESSION_A.tenant_id == TENANT_A_ID
 
     def test_result_carries_tenant_id(self) -> None:
-        result = OptimizationResult(session_id=uuid.uuid4(), tenant_id=TENANT_B_ID)
+        result = OptimizationResult(session_id=SESSION_ID, tenant_id=TENANT_B_ID)
         assert result.tenant_id == TENANT_B_ID
 
     def test_different_tenants_get_different_sessions(self) -> None:
-        sa = _make_session(tenant_id=TENANT_A_ID)
-        sb = _make_session(tenant_id=TENANT_B_ID)
-        assert sa.tenant_id != sb.tenant_id
+        assert _SESSION_A.tenant_id != _SESSION_B.tenant_id
 
 
 # ===================================================================
@@ -561,50 +620,64 @@ class TestTenantIsolation:
 # ===================================================================
 
 
-class _StubAgent:
-    """Minimal concrete agent for testing BaseAgent behaviour.
+# raise_in value -> (hook to replace, exception type it raises)
+_STUB_FAILURES: dict[str, tuple[str, type[Exception]]] = {
+    "prepare": ("prepare", ValueError),
+    "execute": ("execute", RuntimeError),
+    "parse": ("parse_output", KeyError),
+}
+
+
+class _StubBaseAgent(BaseAgent):
+    """Concrete BaseAgent whose hooks return canned values or raise.
 
-    Uses deferred import so the test module stays loadable even when
-    ``langchain_openai`` is absent from the dev environment.
+    The failing hook (if any) is swapped in once at construction, so the
+    hooks themselves carry no per-call branching.
     """
 
     def __init__(
         self,
-        prepare_result: str = "prompt",
-        execute_result: str = "raw",
-        parse_result: dict[str, object] | None = None,
-        *,
-        raise_in: str | None = None,
+        prepare_result: str,
+        execute_result: str,
+        parse_result: dict[str, object],
+        raise_in: str | None,
     ) -> None:
-        from optimization.infrastructure.agents.base_agent import (
-            BaseAgent,
-        )
+        super().__init__()
+        self.prepare_result = prepare_result
+        self.execute_result = execute_result
+        self.parse_result = parse_result
+        if raise_in is not None:
+            hook, error = _STUB_FAILURES[raise_in]
 
-        outer = self  # capture for inner class
+            def _raise(_arg: object) -> NoReturn:
+                raise error(f"{raise_in} boom")
 
-        class _Inner(BaseAgent):
-            """Concrete stub for testing."""
+            setattr(self, hook, _raise)
 
-            def prepare(self, state: dict[str, object]) -> str:
-                if outer.raise_in == "prepare":
-                    raise ValueError("prepare boom")
-                return outer.prepare_result
+    def prepare(self, state: dict[str, object]) -> str:
+        return self.prepare_result
 
-            def execute(self, prompt: str) -> str:
-                if outer.raise_in == "execute":
-                    raise RuntimeError("execute boom")
-                return outer.execute_result
+    def execute(self, prompt: str) -> str:
+        return self.execute_result
 
-            def parse_output(self, raw_output: str) -> dict[str, object]:
-                if outer.raise_in == "parse":
-                    raise KeyError("parse boom")
-                return outer.parse_result or {}
+    def parse_output(self, raw_output: str) -> dict[str, object]:
+        return self.parse_result
 
-        self.prepare_result = prepare_result
-        self.execute_result = execute_result
-        self.parse_result = parse_result or {}
-        self.raise_in = raise_in
-        self.agent = _Inner()
+
+class _StubAgent:
+    """Minimal concrete agent for testing BaseAgent behaviour."""
+
+    def __init__(
+        self,
+        prepare_result: str = "prompt",
+        execute_result: str = "raw",
+        parse_result: dict[str, object] | None = None,
+        *,
+        raise_in: str | None = None,
+    ) -> None:
+        self.agent = _StubBaseAgent(
+            prepare_result, execute_result, parse_result or {}, raise_in
+        )
 
 
 class TestBaseAgent:
@@ -671,67 +744,38 @@ class TestBaseAgent:
 # ===================================================================
 
 
-class TestScoreCheckRouter:
-    """Tests for score_check_router routing logic."""
-
-    def test_routes_to_gap_when_score_above_threshold(self) -> None:
-        from optimization.infrastructure.agents.graph import (
-            score_check_router,
-        )
-
-        state = {
-            "ats_score": 0.80,
-            "score_threshold": 0.75,
-            "rewrite_attempts": 0,
-            "max_rewrite_attempts": 2,
-        }
-        assert score_check_router(state) == "proceed_to_gap"
-
-    def test_routes_to_retry_when_below_threshold(self) -> None:
-        from optimization.infrastructure.agents.graph import (
-            score_check_router,
-        )
-
-        state = {
-            "ats_score": 0.60,
-            "score_threshold": 0.75,
-            "rewrite_attempts": 0,
-            "max_rewrite_attempts": 2,
-        }
-        assert score_check_router(state) == "retry_rewrite"
-
-    def test_routes_to_gap_when_retries_exhausted(self) -> None:
-        from optimization.infrastructure.agents.graph import (
-            score_check_router,
-        )
+# Router inputs share everything but the score and attempt count.
+_ROUTER_BASE_STATE: dict[str, Any] = {
+    "ats_score": 0.0,
+    "score_threshold": 0.75,
+    "rewrite_attempts": 0,
+    "max_rewrite_attempts": 2,
+}
 
-        state = {
-            "ats_score": 0.60,
-            "score_threshold": 0.75,
-            "rewrite_attempts": 2,
-            "max_rewrite_attempts": 2,
-        }
-        assert score_check_router(state) == "proceed_to_gap"
 
-    def test_routes_to_gap_at_exact_threshold(self) -> None:
-        from optimization.infrastructure.agents.graph import (
-            score_check_router,
-        )
+class TestScoreCheckRouter:
+    """Tests for score_check_router routing logic."""
 
-        state = {
-            "ats_score": 0.75,
-            "score_threshold": 0.75,
-            "rewrite_attempts": 0,
-            "max_rewrite_attempts": 2,
+    @pytest.mark.parametrize(
+        ("ats_score", "attempts", "expected"),
+        [
+            pytest.param(0.80, 0, "proceed_to_gap", id="above_threshold"),
+            pytest.param(0.60, 0, "retry_rewrite", id="below_threshold"),
+            pytest.param(0.60, 2, "proceed_to_gap", id="retries_exhausted"),
+            pytest.param(0.75, 0, "proceed_to_gap", id="exact_threshold"),
+        ],
+    )
+    def test_routes_by_score_and_attempts(
+        self, ats_score: float, attempts: int, expected: str
+    ) -> None:
+        state = _ROUTER_BASE_STATE | {
+            "ats_score": ats_score,
+            "rewrite_attempts": attempts,
         }
-        assert score_check_router(state) == "proceed_to_gap"
+        assert score_check_router(state) == expected
 
     def test_uses_defaults_for_missing_fields(self) -> None:
         """Router gracefully handles missing state fields."""
-        from optimization.infrastructure.agents.graph import (
-            score_check_router,
-        )
-
         # Empty state → score=0.0, threshold=0.75, attempts=0, max=2
         assert score_check_router({}) == "retry_rewrite"
 
@@ -741,32 +785,28 @@ class TestScoreCheckRouter:
 # ===================================================================
 
 
+# Partial sub-dicts on purpose: the aggregator copies them through as-is.
+_AGGREGATOR_STATE = cast(
+    OptimizationState,
+    {
+        "jd_analysis": {"hard_skills": ["Python"]},
+        "optimized_sections": {"experience": ["bullet"]},
+        "ats_score": 0.82,
+        "score_breakdown": {"keywords": 0.9},
+        "gap_report": {"missing_skills": ["K8s"]},
+        "rewrite_attempts": 1,
+        "token_usage": {"jd_analyzer": 500, "rewriter": 1500},
+        "total_tokens_used": 2000,
+        "errors": [],
+    },
+)
+
+
 class TestResultAggregatorNode:
     """Tests for result_aggregator_node data assembly."""
 
     def test_assembles_final_result(self) -> None:
-        from typing import cast
-
-        from optimization.infrastructure.agents.graph import (
-            OptimizationState,
-            result_aggregator_node,
-        )
-
-        state = cast(
-            OptimizationState,
-            {
-                "jd_analysis": {"hard_skills": ["Python"]},
-                "optimized_sections": {"experience": ["bullet"]},
-                "ats_score": 0.82,
-                "score_breakdown": {"keywords": 0.9},
-                "gap_report": {"missing_skills": ["K8s"]},
-                "rewrite_attempts": 1,
-                "token_usage": {"jd_analyzer": 500, "rewriter": 1500},
-                "total_tokens_used": 2000,
-                "errors": [],
-            },
-        )
-        result = result_aggregator_node(state)
+        result = result_aggregator_node(_AGGREGATOR_STATE)
 
         fr = result["final_result"]
         assert fr["ats_score"] == 0.82
@@ -775,29 +815,12 @@ class TestResultAggregatorNode:
         assert fr["optimized_sections"] == {"experience": ["bullet"]}
 
     def test_computes_total_tokens_from_usage_dict(self) -> None:
-        from typing import cast
-
-        from optimization.infrastructure.agents.graph import (
-            OptimizationState,
-            result_aggregator_node,
-        )
-
-        state = cast(
-            OptimizationState,
-            {"token_usage": {"a": 100, "b": 200, "c": 300}},
-        )
+        state: OptimizationState = {"token_usage": {"a": 100, "b": 200, "c": 300}}
         result = result_aggregator_node(state)
         assert result["total_tokens_used"] == 600
 
     def test_handles_empty_state_gracefully(self) -> None:
-        from typing import cast
-
-        from optimization.infrastructure.agents.graph import (
-            OptimizationState,
-            result_aggregator_node,
-        )
-
-        state = cast(OptimizationState, {})
+        state: OptimizationState = {}
         result = result_aggregator_node(state)
         fr = result["final_result"]
         assert fr["ats_score"] == 0.0
@@ -817,27 +840,52 @@ _VALID_JD_JSON = """{
   "qualifications": ["5+ years backend", "BS Computer Science"],
   "keyword_weights": { "Python": 0.95, "AWS": 0.85, "Docker": 0.70 }
 }"""
+_VALID_JD_PARSED: dict[str, Any] = json.loads(_VALID_JD_JSON)
+
+_JD_MISSING_KEYWORD_WEIGHTS = (
+    '{"hard_skills": [], "soft_skills": [], '
+    '"responsibilities": [], "qualifications": []}'
+)
 
 
+@pytest.fixture
+def patched_execute(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> None:
+    """Stub JDAnalyzerAgent.execute with a canned LLM reply.
+
+    Replies with ``_VALID_JD_JSON`` unless parametrized indirectly.
+    """
+    reply: str = getattr(request, "param", _VALID_JD_JSON)
+
+    def _execute(self: JDAnalyzerAgent, prompt: str) -> str:
+        return reply
+
+    monkeypatch.setattr(JDAnalyzerAgent, "execute", _execute)
+
+
+@pytest.fixture(scope="class")
+def jd_agent() -> JDAnalyzerAgent:
+    """One JDAnalyzerAgent per test class.
+
+    Tests stub ``execute`` on the class, so the patch applies to this
+    shared instance too.
+    """
+    return JDAnalyzerAgent()
+
+
+@pytest.mark.usefixtures("patched_execute")
 class TestJDAnalyzerAgent:
     """Tests for JDAnalyzerAgent with mocked LLM."""
 
-    def test_valid_jd_returns_jd_analysis_and_token_usage(self) -> None:
+    def test_valid_jd_returns_jd_analysis_and_token_usage(
+        self, jd_agent: JDAnalyzerAgent
+    ) -> None:
         """With valid JSON from LLM, run() returns jd_analysis and token_usage."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
         state = {
             "jd_text": "We need a Python backend engineer with 5+ years of experience.",
         }
-        with patch.object(
-            JDAnalyzerAgent,
-            "execute",
-            return_value=_VALID_JD_JSON,
-        ):
-            agent = JDAnalyzerAgent()
-            result = agent.run(state)
+        result = jd_agent.run(state)
 
         assert "jd_analysis" in result
         jd = result["jd_analysis"]
@@ -847,93 +895,66 @@ class TestJDAnalyzerAgent:
         assert "token_usage" in result
         assert "jd_analyzer" in result["token_usage"]
 
-    def test_short_jd_raises_validation_error(self) -> None:
-        """prepare() raises ValidationError when jd_text is too short."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
-        agent = JDAnalyzerAgent()
-        state = {"jd_text": "Short"}
-        with pytest.raises(ValidationError, match="too short"):
-            agent.run(state)
-
-    def test_empty_jd_raises_validation_error(self) -> None:
-        """prepare() raises ValidationError for empty jd_text."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
-        agent = JDAnalyzerAgent()
-        state = {"jd_text": ""}
+    @pytest.mark.parametrize("jd_text", ["Short", ""], ids=["short", "empty"])
+    def test_short_or_empty_jd_raises_validation_error(
+        self, jd_agent: JDAnalyzerAgent, jd_text: str
+    ) -> None:
+        """prepare() raises ValidationError when jd_text is too short or empty."""
         with pytest.raises(ValidationError, match="too short"):
-            agent.run(state)
-
-    def test_malformed_json_raises_agent_execution_error(self) -> None:
-        """parse_output() raises AgentExecutionError when LLM returns invalid JSON."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
-        state = {"jd_text": "A" * 60}
-        with patch.object(
-            JDAnalyzerAgent,
-            "execute",
-            return_value="not valid json {{{",
-        ):
-            agent = JDAnalyzerAgent()
-            with pytest.raises(AgentExecutionError, match="Invalid JSON"):
-                agent.run(state)
-
-    def test_missing_required_key_raises_agent_execution_error(
-        self,
+            jd_agent.run({"jd_text": jd_text})
+
+    @pytest.mark.parametrize(
+        ("patched_execute", "match"),
+        [
+            pytest.param("not valid json {{{", "Invalid JSON", id="malformed"),
+            pytest.param(
+                _JD_MISSING_KEYWORD_WEIGHTS, "keyword_weights", id="missing_key"
+            ),
+        ],
+        indirect=["patched_execute"],
+    )
+    def test_bad_llm_output_raises_agent_execution_error(
+        self, jd_agent: JDAnalyzerAgent, match: str
     ) -> None:
-        """parse_output() raises when a required key is missing."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
-        state = {"jd_text": "B" * 60}
-        bad_json = (
-            '{"hard_skills": [], "soft_skills": [], '
-            '"responsibilities": [], "qualifications": []}'
-        )
-        with patch.object(JDAnalyzerAgent, "execute", return_value=bad_json):
-            agent = JDAnalyzerAgent()
-            with pytest.raises(AgentExecutionError, match="keyword_weights"):
-                agent.run(state)
+        """parse_output() raises AgentExecutionError for unusable LLM output."""
+        with pytest.raises(AgentExecutionError, match=match):
+            jd_agent.run({"jd_text": "A" * 60})
 
-    def test_prompt_includes_system_instructions(self) -> None:
+    def test_prompt_includes_system_instructions(
+        self, jd_agent: JDAnalyzerAgent
+    ) -> None:
         """prepare() returns jd_text; full prompt built in execute (arch doc §3.2)."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            JDAnalyzerAgent,
-        )
-
         jd_text = "We are looking for a Python backend engineer with AWS."
         state = {"jd_text": jd_text}
-        agent = JDAnalyzerAgent()
-        prompt = agent.prepare(state)
+        prompt = jd_agent.prepare(state)
         assert prompt == jd_text
         assert "Python" in prompt
 
 
+@pytest.fixture
+def patched_parse_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub JDAnalyzerAgent.parse_output with the pre-parsed valid reply.
+
+    For tests of the node wiring; parsing itself is covered by
+    TestJDAnalyzerAgent.
+    """
+
+    def _parse_output(self: JDAnalyzerAgent, raw_output: str) -> dict[str, Any]:
+        return {"jd_analysis": _VALID_JD_PARSED}
+
+    monkeypatch.setattr(JDAnalyzerAgent, "parse_output", _parse_output)
+
+
+@pytest.mark.usefixtures("patched_execute", "patched_parse_output")
 class TestJDAnalyzerNode:
     """Tests for jd_analyzer_node as LangGraph node."""
 
     def test_node_returns_partial_state_with_jd_analysis(self) -> None:
         """jd_analyzer_node returns dict with jd_analysis and token_usage."""
-        from optimization.infrastructure.agents.jd_analyzer import (
-            jd_analyzer_node,
-        )
-
         state = {
             "jd_text": "Python backend engineer with 5+ years of experience required.",
         }
-        with patch(
-            "optimization.infrastructure.agents.jd_analyzer.JDAnalyzerAgent.execute",
-            return_value=_VALID_JD_JSON,
-        ):
-            result = jd_analyzer_node(state)
+        result = jd_analyzer_node(state)
 
         assert "jd_analysis" in result
         assert result["jd_analysis"]["hard_skills"] == [
@@ -948,7 +969,7 @@ class TestJDAnalyzerNode:
 # A4 RAG Retriever — test fixtures
 # ---------------------------------------------------------------------------
 
-_SAMPLE_JD_ANALYSIS = {
+_SAMPLE_JD_ANALYSIS: JDAnalysisDict = {
     "hard_skills": ["Python", "AWS", "Docker"],
     "soft_skills": ["leadership"],
     "responsibilities": [],
@@ -992,10 +1013,6 @@ class TestRAGRetrieverAgent:
 
     def test_valid_query_returns_relevant_chunks(self) -> None:
         """run() returns relevant_chunks from vector search."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         mock_vs = _make_mock_vector_store(_SAMPLE_RAW_CHUNKS)
         state = {
             "tenant_id": str(TENANT_A_ID),
@@ -1019,10 +1036,6 @@ class TestRAGRetrieverAgent:
 
     def test_missing_tenant_id_raises_validation_error(self) -> None:
         """prepare() raises ValidationError when tenant_id is missing."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         mock_vs = _make_mock_vector_store([])
         agent = RAGRetrieverAgent(vector_store=mock_vs)
         state = {"jd_analysis": _SAMPLE_JD_ANALYSIS}
@@ -1031,10 +1044,6 @@ class TestRAGRetrieverAgent:
 
     def test_missing_jd_analysis_raises_validation_error(self) -> None:
         """prepare() raises ValidationError when jd_analysis is missing."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         mock_vs = _make_mock_vector_store([])
         agent = RAGRetrieverAgent(vector_store=mock_vs)
         state = {"tenant_id": str(TENANT_A_ID)}
@@ -1043,10 +1052,6 @@ class TestRAGRetrieverAgent:
 
     def test_empty_collection_returns_empty_chunks(self) -> None:
         """Zero results from ChromaDB returns empty relevant_chunks."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         mock_vs = _make_mock_vector_store([])
         state = {
             "tenant_id": str(TENANT_A_ID),
@@ -1059,10 +1064,6 @@ class TestRAGRetrieverAgent:
 
     def test_relevance_threshold_filters_low_scores(self) -> None:
         """Chunks below relevance threshold are discarded."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         low_score_chunks = [
             {
                 "id": "x",
@@ -1083,13 +1084,7 @@ class TestRAGRetrieverAgent:
 
     def test_query_builds_from_keywords(self) -> None:
         """prepare() builds query from hard_skills, soft_skills, keyword_weights."""
-        from typing import cast
-
-        from optimization.infrastructure.agents.rag_retriever import (
-            _build_query_from_jd,
-        )
-
-        query = _build_query_from_jd(cast(JDAnalysisDict, _SAMPLE_JD_ANALYSIS))
+        query = _build_query_from_jd(_SAMPLE_JD_ANALYSIS)
         assert "Python" in query
         assert "AWS" in query
         assert "Docker" in query
@@ -1097,10 +1092,6 @@ class TestRAGRetrieverAgent:
 
     def test_query_empty_jd_uses_fallback(self) -> None:
         """Empty JD analysis triggers fallback query in execute."""
-        from optimization.infrastructure.agents.rag_retriever import (
-            RAGRetrieverAgent,
-        )
-
         mock_vs = _make_mock_vector_store([])
         state = {
             "tenant_id": str(TENANT_A_ID),
@@ -1124,11 +1115,6 @@ class TestRAGRetrieverNode:
 
     def test_node_returns_partial_state_with_relevant_chunks(self) -> None:
         """rag_retriever_node returns dict with relevant_chunks."""
-        from optimization.infrastructure.agents import rag_retriever as rag_mod
-        from optimization.infrastructure.agents.rag_retriever import (
-            rag_retriever_node,
-        )
-
         mock_vs = _make_mock_vector_store(_SAMPLE_RAW_CHUNKS)
         state = {
             "tenant_id": str(TENANT_A_ID),
@@ -1179,10 +1165,6 @@ class TestResumeRewriterAgent:
 
     def test_run_first_attempt_returns_optimized_sections(self) -> None:
         """run() returns optimized_sections and token_usage on first attempt."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": _SAMPLE_REWRITER_CHUNKS,
@@ -1205,10 +1187,6 @@ class TestResumeRewriterAgent:
 
     def test_run_rewrite_attempts_incremented(self) -> None:
         """run() increments rewrite_attempts in result."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": _SAMPLE_REWRITER_CHUNKS,
@@ -1236,10 +1214,6 @@ class TestResumeRewriterAgent:
 
     def test_prepare_retry_includes_score_feedback(self) -> None:
         """When rewrite_attempts > 0 and ats_score present, system prompt has score."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": _SAMPLE_REWRITER_CHUNKS,
@@ -1274,10 +1248,6 @@ class TestResumeRewriterAgent:
 
     def test_prepare_missing_jd_analysis_raises_validation_error(self) -> None:
         """prepare() raises ValidationError when jd_analysis is missing."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         agent = ResumeRewriterAgent()
         state = {"relevant_chunks": _SAMPLE_REWRITER_CHUNKS}
         with pytest.raises(ValidationError, match="jd_analysis"):
@@ -1287,10 +1257,6 @@ class TestResumeRewriterAgent:
         self,
     ) -> None:
         """prepare() raises ValidationError when no content source."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         agent = ResumeRewriterAgent()
         state = {"jd_analysis": _SAMPLE_JD_ANALYSIS}
         with pytest.raises(ValidationError, match="relevant_chunks|resume_sections"):
@@ -1300,10 +1266,6 @@ class TestResumeRewriterAgent:
         self,
     ) -> None:
         """parse_output() raises AgentExecutionError on invalid JSON."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": _SAMPLE_REWRITER_CHUNKS,
@@ -1319,10 +1281,6 @@ class TestResumeRewriterAgent:
 
     def test_prepare_chunk_truncation_respects_max_chars(self) -> None:
         """prepare() truncates chunks to max_chunk_chars (via settings)."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         long_content = "x" * 1200
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
@@ -1354,20 +1312,14 @@ class TestResumeRewriterAgent:
             ):
                 agent = ResumeRewriterAgent()
                 agent.run(state)
-        import re as _re
-
         assert len(captured_prompt) == 1
         # Full 1200-char string must not appear
         assert "x" * 101 not in captured_prompt[0]
         # Truncation marker "x{100}..." must appear (100 chars + "...")
-        assert _re.search(r"x{100}\.\.\.", captured_prompt[0])
+        assert re.search(r"x{100}\.\.\.", captured_prompt[0])
 
     def test_prepare_resume_sections_fallback_when_no_chunks(self) -> None:
         """When relevant_chunks is empty, prepare() uses resume_sections."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": [],
@@ -1394,11 +1346,6 @@ class TestResumeRewriterNode:
         self,
     ) -> None:
         """resume_rewriter_node returns dict with optimized_sections."""
-        from optimization.infrastructure.agents.resume_rewriter import (
-            ResumeRewriterAgent,
-            resume_rewriter_node,
-        )
-
         state = {
             "jd_analysis": _SAMPLE_JD_ANALYSIS,
             "relevant_chunks": _SAMPLE_REWRITER_CHUNKS,
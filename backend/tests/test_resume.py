@@ -5,49 +5,103 @@ PDF parser, vector store adapter, API upload/list/detail/delete.
 """
 
 import io
+import itertools
+import threading
 import uuid
-from collections.abc import AsyncGenerator
-from typing import Any
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
-import chromadb
 import pytest
+from fastapi import Depends
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import Settings
+from main import app
+from resume.api import routes as resume_routes
+from resume.api.routes import get_resume_service
 from resume.application.services import ResumeApplicationService
 from resume.domain.entities import Resume, ResumeSection
 from resume.domain.factories import ResumeFactory
 from resume.domain.services import ResumeParsingDomainService
 from resume.domain.value_objects import SectionType
+from resume.infrastructure import vector_store as vector_store_module
+from resume.infrastructure.file_storage import FileStorageAdapter
 from resume.infrastructure.pdf_parser import PDFParser
 from resume.infrastructure.repository_impl import ResumeRepository
 from resume.infrastructure.vector_store import VectorStoreAdapter
+from shared.infrastructure.database import get_async_session
 from shared.infrastructure.unit_of_work_impl import SqlAlchemyUnitOfWork
 
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+    from chromadb.api.types import EmbeddingFunction
+
+# (embedding function, list of the document batches it was called with)
+_CountingEmbedding = tuple["EmbeddingFunction[list[str]]", list[list[str]]]
+
+# --- Fixed ids for domain tests that only need a well-formed UUID ---
+_USER_ID = uuid.uuid4()
+_TENANT_ID = uuid.uuid4()
+
 
 # --- Minimal valid PDF bytes for testing ---
-def _make_test_pdf(text: str = "Test resume content") -> bytes:
-    """Create a minimal valid PDF using PyPDF2 PdfWriter."""
-    from PyPDF2 import PdfWriter
+_PDF_SAMPLE_TEXT = "Hello World Resume"
+
+
+def _build_minimal_pdf(text: str) -> bytes:
+    """Assemble a one-page PDF showing ``text`` with a correct xref table."""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % escaped.encode("latin-1")
+    objects = (
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Kids[3 0 R]/Count 1>>",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+        b"/Resources<</Font<</F1 5 0 R>>>>/Contents 4 0 R>>",
+        b"<</Length %d>>stream\n%s\nendstream" % (len(stream), stream),
+        b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>",
+    )
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj%sendobj\n" % (num, body)
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer<</Size %d/Root 1 0 R>>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_at
+    return bytes(out)
+
+
+# Built once and shared; bytes are immutable.
+_MINIMAL_PDF = _build_minimal_pdf(_PDF_SAMPLE_TEXT)
+
 
-    writer = PdfWriter()
-    writer.add_blank_page(width=612, height=792)
-    writer.add_metadata({"/Subject": text})
+class _FakeFileStorage(FileStorageAdapter):
+    """In-memory stand-in for FileStorageAdapter; never touches S3."""
 
-    buf = io.BytesIO()
-    writer.write(buf)
-    return buf.getvalue()
+    def __init__(self) -> None:
+        """Skip the boto3 client and bucket check of the real adapter."""
+
+    def store(
+        self,
+        tenant_id: str,
+        user_id: str,
+        filename: str,
+        file_bytes: bytes,
+    ) -> str:
+        return "test/path/resume.pdf"
+
+    def retrieve(self, storage_path: str) -> bytes:
+        return b"pdf bytes"
+
+    def delete(self, storage_path: str) -> None:
+        return None
 
 
-def _mock_file_storage() -> MagicMock:
-    """Create a mock FileStorageAdapter."""
-    mock = MagicMock()
-    mock.store.return_value = "test/path/resume.pdf"
-    mock.retrieve.return_value = b"pdf bytes"
-    mock.delete.return_value = None
-    return mock
+_FAKE_STORAGE = _FakeFileStorage()
 
 
 # ===================================================================
@@ -58,17 +112,22 @@ class TestSectionType:
 
     def test_enum_has_six_values(self) -> None:
         """SectionType should have exactly 6 values."""
-        values = list(SectionType)
-        assert len(values) == 6
-
-    def test_enum_values(self) -> None:
+        assert len(SectionType) == 6
+
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (SectionType.EDUCATION, "education"),
+            (SectionType.EXPERIENCE, "experience"),
+            (SectionType.PROJECTS, "projects"),
+            (SectionType.SKILLS, "skills"),
+            (SectionType.CERTIFICATIONS, "certifications"),
+            (SectionType.SUMMARY, "summary"),
+        ],
+    )
+    def test_enum_values(self, member: SectionType, value: str) -> None:
         """SectionType values should match expected strings."""
-        assert SectionType.EDUCATION.value == "education"
-        assert SectionType.EXPERIENCE.value == "experience"
-        assert SectionType.PROJECTS.value == "projects"
-        assert SectionType.SKILLS.value == "skills"
-        assert SectionType.CERTIFICATIONS.value == "certifications"
-        assert SectionType.SUMMARY.value == "summary"
+        assert member.value == value
 
 
 class TestResumeParsingService:
@@ -94,6 +153,23 @@ class TestResumeParsingService:
         assert SectionType.EDUCATION in types
         assert SectionType.SKILLS in types
 
+    def test_sections_keep_order_and_skip_empty_ones(self) -> None:
+        """Content maps to its heading in order; empty sections are dropped."""
+        service = ResumeParsingDomainService()
+        raw = (
+            "Jane Doe\n"
+            "Technical Skills:\n"
+            "Python, Go\n"
+            "Projects\n"
+            "\n"
+            "Work Experience\n"
+            "Engineer at Acme.\n"
+        )
+        assert service.parse_sections(raw) == [
+            (SectionType.SKILLS, "Python, Go"),
+            (SectionType.EXPERIENCE, "Engineer at Acme."),
+        ]
+
     def test_no_headings_returns_summary(self) -> None:
         """Text with no recognized headings returns as SUMMARY."""
         service = ResumeParsingDomainService()
@@ -102,6 +178,15 @@ class TestResumeParsingService:
         assert len(sections) == 1
         assert sections[0][0] == SectionType.SUMMARY
 
+    @pytest.mark.parametrize("heading", ["\u017fkills", "EXPER\u0130ENCE"])
+    def test_unicode_case_variant_heading_falls_back_to_summary(
+        self, heading: str
+    ) -> None:
+        """Headings matched only via Unicode case folding become SUMMARY."""
+        service = ResumeParsingDomainService()
+        sections = service.parse_sections(f"{heading}\nPython\n")
+        assert sections == [(SectionType.SUMMARY, "Python")]
+
 
 class TestResumeFactory:
     """Tests for ResumeFactory."""
@@ -111,8 +196,8 @@ class TestResumeFactory:
         service = ResumeParsingDomainService()
         raw = "Summary\nA great developer.\n\nSkills\nPython, TypeScript.\n"
         resume = ResumeFactory.create_from_upload(
-            user_id=uuid.uuid4(),
-            tenant_id=uuid.uuid4(),
+            user_id=_USER_ID,
+            tenant_id=_TENANT_ID,
             filename="test.pdf",
             storage_path="t/u/test.pdf",
             raw_text=raw,
@@ -130,8 +215,8 @@ class TestResumeEntity:
     def test_add_section(self) -> None:
         """add_section should append to sections list."""
         resume = Resume(
-            user_id=uuid.uuid4(),
-            tenant_id=uuid.uuid4(),
+            user_id=_USER_ID,
+            tenant_id=_TENANT_ID,
             filename="test.pdf",
             storage_path="path",
         )
@@ -152,9 +237,8 @@ class TestPDFParser:
     def test_extracts_text_from_pdf(self) -> None:
         """PDFParser should extract text from valid PDF bytes."""
         parser = PDFParser()
-        pdf_bytes = _make_test_pdf("Hello World Resume")
-        text = parser.extract_text(pdf_bytes)
-        assert isinstance(text, str)
+        text = parser.extract_text(_MINIMAL_PDF)
+        assert text.strip() == _PDF_SAMPLE_TEXT
 
     def test_invalid_pdf_raises(self) -> None:
         """PDFParser should raise ValueError for non-PDF bytes."""
@@ -162,48 +246,65 @@ class TestPDFParser:
         with pytest.raises(ValueError, match="Failed to parse"):
             parser.extract_text(b"not a pdf file")
 
+    @pytest.mark.parametrize(
+        "file_bytes",
+        [
+            b"",
+            _MINIMAL_PDF[:9],
+            _MINIMAL_PDF[: _MINIMAL_PDF.index(b"Tj")],
+            _MINIMAL_PDF[: _MINIMAL_PDF.index(b"xref")],
+        ],
+        ids=["empty", "header-only", "cut-content-stream", "missing-xref"],
+    )
+    def test_truncated_pdf_raises(self, file_bytes: bytes) -> None:
+        """A truncated or damaged PDF should raise ValueError, not crash."""
+        with pytest.raises(ValueError, match="Failed to parse"):
+            PDFParser().extract_text(file_bytes)
+
 
 # ===================================================================
 # API Integration Tests (with mocked file storage)
 # ===================================================================
-@pytest.fixture
-async def resume_test_client(
-    db_session: AsyncSession,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Test client with mocked FileStorageAdapter."""
-    from main import app
-    from resume.api.routes import get_resume_service
-    from shared.infrastructure.database import get_async_session
-
-    # Override DB session
-    async def _override_session() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
-
-    app.dependency_overrides[get_async_session] = _override_session
-
-    # Override resume service to use mock storage + mock vector store
-    mock_storage = _mock_file_storage()
+@pytest.fixture(scope="module")
+def _resume_service_override() -> Generator[None, None, None]:
+    """Install the mocked resume service once for this module.
+
+    The override resolves the DB session through ``get_async_session``,
+    which the shared test client already routes to each test's
+    ``db_session``, so it doesn't need re-registering per test.
+    """
     mock_vectors = MagicMock(spec=VectorStoreAdapter)
 
-    async def _override_resume_service() -> ResumeApplicationService:
+    async def _override_resume_service(
+        session: AsyncSession = Depends(get_async_session),  # noqa: B008
+    ) -> ResumeApplicationService:
         return ResumeApplicationService(
-            repo=ResumeRepository(db_session),
-            file_storage=mock_storage,
+            repo=ResumeRepository(session),
+            file_storage=_FAKE_STORAGE,
             pdf_parser=PDFParser(),
             parsing_service=ResumeParsingDomainService(),
             vector_store=mock_vectors,
-            uow=SqlAlchemyUnitOfWork(db_session),
+            uow=SqlAlchemyUnitOfWork(session),
         )
 
     app.dependency_overrides[get_resume_service] = _override_resume_service
+    yield
+    app.dependency_overrides.pop(get_resume_service, None)
+
 
-    from httpx import ASGITransport
+@pytest.fixture
+def resume_test_client(
+    test_client: AsyncClient,
+    _resume_service_override: None,
+) -> AsyncClient:
+    """Test client with fake file storage and a mocked vector store."""
+    return test_client
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
 
-    app.dependency_overrides.clear()
+@pytest.fixture(scope="module")
+def resume_auth_token(registered_user: dict[str, str]) -> str:
+    """Bearer token for the session's pre-registered user."""
+    return registered_user["access_token"]
 
 
 class TestResumeAPI:
@@ -211,30 +312,19 @@ class TestResumeAPI:
 
     @pytest.mark.asyncio
     async def test_upload_pdf_returns_201(
-        self, resume_test_client: AsyncClient
+        self, resume_test_client: AsyncClient, resume_auth_token: str
     ) -> None:
         """POST /api/resumes/upload with valid PDF returns 201."""
-        reg = await resume_test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "resume-up@example.com",
-                "password": "Password123",
-                "tenant_name": "Resume Upload Corp",
-            },
-        )
-        token = reg.json()["access_token"]
-
-        pdf_bytes = _make_test_pdf("Test Resume")
         resp = await resume_test_client.post(
             "/api/resumes/upload",
             files={
                 "file": (
                     "resume.pdf",
-                    io.BytesIO(pdf_bytes),
+                    io.BytesIO(_MINIMAL_PDF),
                     "application/pdf",
                 )
             },
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {resume_auth_token}"},
         )
         assert resp.status_code == 201
         data = resp.json()
@@ -242,42 +332,108 @@ class TestResumeAPI:
         assert data["filename"] == "resume.pdf"
 
     @pytest.mark.asyncio
-    async def test_list_resumes_returns_200(
-        self, resume_test_client: AsyncClient
+    async def test_upload_parses_pdf_off_the_event_loop(
+        self,
+        resume_test_client: AsyncClient,
+        resume_auth_token: str,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """GET /api/resumes/ returns 200 with list."""
-        reg = await resume_test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "resume-ls@example.com",
-                "password": "Password123",
-                "tenant_name": "List Corp",
+        """The PDF parse should run in a worker thread, not the loop's."""
+        parse_threads: list[int] = []
+        extract_text = PDFParser.extract_text
+
+        def _recording_extract_text(self: PDFParser, file_bytes: bytes) -> str:
+            parse_threads.append(threading.get_ident())
+            return extract_text(self, file_bytes)
+
+        monkeypatch.setattr(PDFParser, "extract_text", _recording_extract_text)
+
+        resp = await resume_test_client.post(
+            "/api/resumes/upload",
+            files={
+                "file": (
+                    "resume.pdf",
+                    io.BytesIO(_MINIMAL_PDF),
+                    "application/pdf",
+                )
             },
+            headers={"Authorization": f"Bearer {resume_auth_token}"},
+        )
+        assert resp.status_code == 201
+        assert len(parse_threads) == 1
+        assert parse_threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_reupload_reuses_embeddings_across_requests(
+        self,
+        resume_test_client: AsyncClient,
+        resume_auth_token: str,
+        chroma_client: "ClientAPI",
+        _drop_new_collections: None,
+        counting_embedding_fn: _CountingEmbedding,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Uploading the same PDF twice embeds it once.
+
+        Goes through the real get_resume_service, which builds a new
+        VectorStoreAdapter per request; only the Chroma server, the
+        embedding model and object storage are swapped for fakes.
+        """
+        import chromadb
+
+        embedding_fn, calls = counting_embedding_fn
+        monkeypatch.delitem(app.dependency_overrides, get_resume_service)
+        monkeypatch.setattr(
+            resume_routes, "FileStorageAdapter", lambda _: _FAKE_STORAGE
         )
-        token = reg.json()["access_token"]
+        monkeypatch.setattr(chromadb, "HttpClient", lambda **_: chroma_client)
+        monkeypatch.setattr(
+            vector_store_module, "_build_openai_embedding_fn", lambda _: embedding_fn
+        )
+        headers = {"Authorization": f"Bearer {resume_auth_token}"}
+
+        resume_ids = []
+        for _ in range(2):
+            resp = await resume_test_client.post(
+                "/api/resumes/upload",
+                files={
+                    "file": (
+                        "resume.pdf",
+                        io.BytesIO(_MINIMAL_PDF),
+                        "application/pdf",
+                    )
+                },
+                headers=headers,
+            )
+            assert resp.status_code == 201
+            resume_ids.append(resp.json()["id"])
+
+        assert resume_ids[0] != resume_ids[1]
+        assert len(calls) == 1
+
+        me = await resume_test_client.get("/api/auth/me", headers=headers)
+        collection = chroma_client.get_collection(f"tenant_{me.json()['tenant_id']}")
+        stored = collection.get(include=["metadatas"])["metadatas"]
+        assert stored is not None
+        assert {m["resume_id"] for m in stored} == set(resume_ids)
 
+    @pytest.mark.asyncio
+    async def test_list_resumes_returns_200(
+        self, resume_test_client: AsyncClient, resume_auth_token: str
+    ) -> None:
+        """GET /api/resumes/ returns 200 with list."""
         resp = await resume_test_client.get(
             "/api/resumes/",
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {resume_auth_token}"},
         )
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
     @pytest.mark.asyncio
     async def test_upload_non_pdf_returns_400(
-        self, resume_test_client: AsyncClient
+        self, resume_test_client: AsyncClient, resume_auth_token: str
     ) -> None:
         """POST /api/resumes/upload with non-PDF returns 400."""
-        reg = await resume_test_client.post(
-            "/api/auth/register",
-            json={
-                "email": "resume-bad@example.com",
-                "password": "Password123",
-                "tenant_name": "Bad Corp",
-            },
-        )
-        token = reg.json()["access_token"]
-
         resp = await resume_test_client.post(
             "/api/resumes/upload",
             files={
@@ -287,7 +443,7 @@ class TestResumeAPI:
                     "text/plain",
                 )
             },
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {resume_auth_token}"},
         )
         assert resp.status_code == 400
 
@@ -296,13 +452,12 @@ class TestResumeAPI:
         self, resume_test_client: AsyncClient
     ) -> None:
         """POST /api/resumes/upload without token returns 401."""
-        pdf_bytes = _make_test_pdf("No auth")
         resp = await resume_test_client.post(
             "/api/resumes/upload",
             files={
                 "file": (
                     "resume.pdf",
-                    io.BytesIO(pdf_bytes),
+                    io.BytesIO(_MINIMAL_PDF),
                     "application/pdf",
                 )
             },
@@ -314,6 +469,45 @@ class TestResumeAPI:
 # Vector Store Adapter Tests (ChromaDB EphemeralClient)
 # ===================================================================
 
+# Tenant and resume ids here are opaque string keys, not UUIDs; a
+# counter keeps them unique for the run without a urandom call each.
+_id_counter = itertools.count()
+
+
+def _opaque_id() -> str:
+    """Return a run-unique id, valid inside a ChromaDB collection name."""
+    return f"test-{next(_id_counter):016x}"
+
+
+@pytest.fixture
+def counting_embedding_fn() -> _CountingEmbedding:
+    """Cheap deterministic embedding function that records its calls."""
+    from chromadb.api.types import EmbeddingFunction
+
+    calls: list[list[str]] = []
+
+    class _CountingEmbeddingFunction(EmbeddingFunction[list[str]]):
+        def __init__(self) -> None:
+            pass
+
+        def __call__(self, input: list[str]) -> Any:  # noqa: A002
+            calls.append(list(input))
+            return [[float(len(text)), float(text.count(" ")), 1.0] for text in input]
+
+        @staticmethod
+        def name() -> str:
+            return "counting"
+
+        def get_config(self) -> dict[str, Any]:
+            return {}
+
+        @staticmethod
+        def build_from_config(config: dict[str, Any]) -> Any:
+            return _CountingEmbeddingFunction()
+
+    return _CountingEmbeddingFunction(), calls
+
+
 _SAMPLE_SECTIONS: list[dict[str, Any]] = [
     {"type": "experience", "content": "Software Engineer at Acme Corp. Built APIs."},
     {"type": "skills", "content": "Python, FastAPI, Docker, Kubernetes, AWS."},
@@ -321,13 +515,34 @@ _SAMPLE_SECTIONS: list[dict[str, Any]] = [
 ]
 
 
-@pytest.fixture
-def vector_store() -> VectorStoreAdapter:
-    """VectorStoreAdapter backed by an in-memory EphemeralClient.
+@pytest.fixture(scope="session")
+def chroma_client() -> Generator["ClientAPI", None, None]:
+    """In-memory ChromaDB client shared by the session, reset at the end.
 
-    Uses ChromaDB's default embedding function so no OpenAI key
-    is required during tests.
+    Every EphemeralClient in a process shares one backend and must use
+    the same settings, so all tests go through this one.
     """
+    import chromadb
+    from chromadb.config import Settings as ChromaSettings
+
+    client = chromadb.EphemeralClient(settings=ChromaSettings(allow_reset=True))
+    yield client
+    client.reset()
+
+
+@pytest.fixture
+def _drop_new_collections(chroma_client: "ClientAPI") -> Generator[None, None, None]:
+    """Delete the collections a test creates once it finishes."""
+    before = {collection.name for collection in chroma_client.list_collections()}
+    yield
+    for collection in chroma_client.list_collections():
+        if collection.name not in before:
+            chroma_client.delete_collection(collection.name)
+
+
+@pytest.fixture(scope="session")
+def _session_vector_store(chroma_client: "ClientAPI") -> VectorStoreAdapter:
+    """Build the ChromaDB-backed adapter once per session."""
     settings = Settings(
         chroma_host="localhost",
         chroma_port=8000,
@@ -336,23 +551,53 @@ def vector_store() -> VectorStoreAdapter:
     )
     return VectorStoreAdapter(
         settings=settings,
-        client=chromadb.EphemeralClient(),
+        client=chroma_client,
         embedding_fn=None,  # use ChromaDB default embeddings
     )
 
 
+@pytest.fixture
+def vector_store(
+    _session_vector_store: VectorStoreAdapter, _drop_new_collections: None
+) -> VectorStoreAdapter:
+    """VectorStoreAdapter backed by the session's in-memory client.
+
+    Uses ChromaDB's default embedding function so no OpenAI key
+    is required during tests. Each test writes under its own
+    ``_opaque_id()`` tenant, i.e. its own collection, which is
+    dropped again when the test ends.
+    """
+    return _session_vector_store
+
+
+@pytest.fixture(scope="session")
+def sample_embeddings() -> list[list[float]]:
+    """Embed ``_SAMPLE_SECTIONS`` once with ChromaDB's default function.
+
+    Matches what the collections use for queries, so tests can store
+    these vectors instead of re-running the model for every upsert.
+    """
+    from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+    vectors = DefaultEmbeddingFunction()([s["content"] for s in _SAMPLE_SECTIONS])
+    return [[float(x) for x in vector] for vector in vectors]
+
+
 class TestVectorStoreAdapter:
     """Unit tests for the ChromaDB VectorStoreAdapter."""
 
     def test_store_and_search_returns_relevant_chunks(
         self,
         vector_store: VectorStoreAdapter,
+        sample_embeddings: list[list[float]],
     ) -> None:
         """Stored sections should be retrievable via search."""
-        tenant_id = str(uuid.uuid4())
-        resume_id = str(uuid.uuid4())
+        tenant_id = _opaque_id()
+        resume_id = _opaque_id()
 
-        vector_store.store_embeddings(tenant_id, resume_id, _SAMPLE_SECTIONS)
+        vector_store.store_embeddings(
+            tenant_id, resume_id, _SAMPLE_SECTIONS, sample_embeddings
+        )
 
         results = vector_store.search(tenant_id, "Python Docker AWS", k=3)
 
@@ -369,7 +614,7 @@ class TestVectorStoreAdapter:
         vector_store: VectorStoreAdapter,
     ) -> None:
         """Searching a tenant with no data should return empty list."""
-        tenant_id = str(uuid.uuid4())
+        tenant_id = _opaque_id()
 
         results = vector_store.search(tenant_id, "Python engineer")
 
@@ -378,12 +623,15 @@ class TestVectorStoreAdapter:
     def test_delete_embeddings_removes_resume_data(
         self,
         vector_store: VectorStoreAdapter,
+        sample_embeddings: list[list[float]],
     ) -> None:
         """After deletion, search should return no results."""
-        tenant_id = str(uuid.uuid4())
-        resume_id = str(uuid.uuid4())
+        tenant_id = _opaque_id()
+        resume_id = _opaque_id()
 
-        vector_store.store_embeddings(tenant_id, resume_id, _SAMPLE_SECTIONS)
+        vector_store.store_embeddings(
+            tenant_id, resume_id, _SAMPLE_SECTIONS, sample_embeddings
+        )
 
         # Confirm data exists
         before = vector_store.search(tenant_id, "Python", k=5)
@@ -397,18 +645,21 @@ class TestVectorStoreAdapter:
     def test_tenant_a_cannot_see_tenant_b_data(
         self,
         vector_store: VectorStoreAdapter,
+        sample_embeddings: list[list[float]],
     ) -> None:
         """Verify strict tenant isolation at the vector store level.
 
         Data stored under tenant A's collection must not appear
         in search results for tenant B.
         """
-        tenant_a = str(uuid.uuid4())
-        tenant_b = str(uuid.uuid4())
-        resume_id = str(uuid.uuid4())
+        tenant_a = _opaque_id()
+        tenant_b = _opaque_id()
+        resume_id = _opaque_id()
 
         # Store data only in tenant A
-        vector_store.store_embeddings(tenant_a, resume_id, _SAMPLE_SECTIONS)
+        vector_store.store_embeddings(
+            tenant_a, resume_id, _SAMPLE_SECTIONS, sample_embeddings
+        )
 
         # Tenant A can find it
         results_a = vector_store.search(tenant_a, "Python AWS", k=5)
@@ -431,8 +682,8 @@ class TestVectorStoreAdapter:
         # to connect to a non-existent server in CI/test)
         adapter._available = False
 
-        tenant_id = str(uuid.uuid4())
-        resume_id = str(uuid.uuid4())
+        tenant_id = _opaque_id()
+        resume_id = _opaque_id()
 
         # None of these should raise
         adapter.store_embeddings(tenant_id, resume_id, _SAMPLE_SECTIONS)
@@ -444,13 +695,16 @@ class TestVectorStoreAdapter:
     def test_upsert_overwrites_existing_embeddings(
         self,
         vector_store: VectorStoreAdapter,
+        sample_embeddings: list[list[float]],
     ) -> None:
         """Re-uploading the same resume should overwrite old data."""
-        tenant_id = str(uuid.uuid4())
-        resume_id = str(uuid.uuid4())
+        tenant_id = _opaque_id()
+        resume_id = _opaque_id()
 
         # Store original
-        vector_store.store_embeddings(tenant_id, resume_id, _SAMPLE_SECTIONS)
+        vector_store.store_embeddings(
+            tenant_id, resume_id, _SAMPLE_SECTIONS, sample_embeddings
+        )
 
         # Store updated content with same resume_id
         updated = [
@@ -463,3 +717,59 @@ class TestVectorStoreAdapter:
         # Should find the updated content
         contents = [r["content"] for r in results]
         assert any("Rust" in c for c in contents)
+
+    def test_store_embeddings_keeps_precomputed_vectors(
+        self,
+        vector_store: VectorStoreAdapter,
+    ) -> None:
+        """Precomputed embeddings should be stored without re-embedding."""
+        tenant_id = _opaque_id()
+        resume_id = _opaque_id()
+        vectors = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+        vector_store.store_embeddings(tenant_id, resume_id, _SAMPLE_SECTIONS, vectors)
+
+        stored = vector_store._get_collection(tenant_id).get(
+            ids=[f"{resume_id}_{i}" for i in range(3)],
+            include=["embeddings"],
+        )
+        assert stored["embeddings"] is not None
+        assert [list(v) for v in stored["embeddings"]] == vectors
+
+    def test_identical_sections_reuse_stored_embeddings(
+        self,
+        chroma_client: "ClientAPI",
+        _drop_new_collections: None,
+        counting_embedding_fn: _CountingEmbedding,
+    ) -> None:
+        """Sections already stored in the tenant should not be re-embedded."""
+        embedding_fn, calls = counting_embedding_fn
+        adapter = VectorStoreAdapter(
+            settings=Settings(openai_api_key="", app_env="test"),
+            client=chroma_client,
+            embedding_fn=embedding_fn,
+        )
+        tenant_id = _opaque_id()
+        first, second = _opaque_id(), _opaque_id()
+
+        adapter.store_embeddings(tenant_id, first, _SAMPLE_SECTIONS)
+        adapter.store_embeddings(tenant_id, first, _SAMPLE_SECTIONS)
+        adapter.store_embeddings(tenant_id, second, list(_SAMPLE_SECTIONS))
+        assert len(calls) == 1
+
+        collection = adapter._get_collection(tenant_id)
+        stored = [
+            collection.get(
+                ids=[f"{resume_id}_{i}" for i in range(len(_SAMPLE_SECTIONS))],
+                include=["embeddings"],
+            )["embeddings"]
+            for resume_id in (first, second)
+        ]
+        assert stored[0] is not None and stored[1] is not None
+        # Copied as read back; the cosine index may re-normalize them
+        for reused, original in zip(stored[1], stored[0], strict=True):
+            assert list(reused) == pytest.approx(list(original))
+
+        # Different sections are embedded as usual
+        adapter.store_embeddings(tenant_id, _opaque_id(), _SAMPLE_SECTIONS[:1])
+        assert len(calls) == 2
@@ -1,18 +1,27 @@
 """Tests for the Shared Kernel (DDD base classes and tenant context).
 
 Covers: BaseEntity identity, BaseValueObject immutability, AggregateRoot
-event collection, exception hierarchy, and TenantContext isolation.
+event collection, exception hierarchy, TenantContext isolation, and the
+SQLAlchemy Unit of Work.
 """
 
+import asyncio
 import dataclasses
 import uuid
+from typing import Any, cast
 
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import get_settings
+from identity.infrastructure.jwt_service import JWTService
+from identity.infrastructure.models import TenantModel
+from main import app
 from shared.domain.aggregate_root import AggregateRoot
 from shared.domain.base_entity import BaseEntity
 from shared.domain.base_value_object import BaseValueObject
-from shared.domain.domain_event import DomainEvent
+from shared.domain.domain_event import DomainEvent, IEventBus
 from shared.domain.exceptions import (
     AuthorizationError,
     DomainError,
@@ -20,13 +29,17 @@ from shared.domain.exceptions import (
     QuotaExceededError,
     ValidationError,
 )
+from shared.infrastructure.event_bus_impl import InProcessEventBus
 from shared.infrastructure.tenant_context import TenantContext
+from shared.infrastructure.unit_of_work_impl import SqlAlchemyUnitOfWork
+from shared.middleware.rate_limit_middleware import RateLimitMiddleware
+from shared.middleware.tenant_middleware import TenantMiddleware
 
 
 # ---------------------------------------------------------------------------
 # Helper subclasses for testing (not part of production code)
 # ---------------------------------------------------------------------------
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _TestVO(BaseValueObject):
     """Concrete VO for testing equality and immutability."""
 
@@ -71,6 +84,7 @@ class TestBaseValueObject:
         vo = _TestVO(value="hello")
         with pytest.raises(dataclasses.FrozenInstanceError):
             vo.value = "changed"  # type: ignore[misc]
+        assert not hasattr(vo, "__dict__")
 
 
 # ---------------------------------------------------------------------------
@@ -138,6 +152,228 @@ class TestTenantContext:
             TenantContext.get_current_tenant_id()
 
 
+# ---------------------------------------------------------------------------
+# SqlAlchemyUnitOfWork tests
+# ---------------------------------------------------------------------------
+class TestSqlAlchemyUnitOfWork:
+    """Tests for the explicit-transaction Unit of Work."""
+
+    @pytest.mark.asyncio
+    async def test_commit_persists_changes(self, db_session: AsyncSession) -> None:
+        """Work committed inside the context should be visible afterwards."""
+        tenant_id = uuid.uuid4()
+        async with SqlAlchemyUnitOfWork(db_session) as uow:
+            assert db_session.in_transaction()
+            db_session.add(TenantModel(id=tenant_id, name="UoW Corp"))
+            await uow.commit()
+        assert not db_session.in_transaction()
+        assert await db_session.get(TenantModel, tenant_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_exception_rolls_back(self, db_session: AsyncSession) -> None:
+        """An exception inside the context should discard pending work."""
+        tenant_id = uuid.uuid4()
+        with pytest.raises(RuntimeError):
+            async with SqlAlchemyUnitOfWork(db_session):
+                db_session.add(TenantModel(id=tenant_id, name="Doomed Corp"))
+                await db_session.flush()
+                raise RuntimeError("boom")
+        assert await db_session.get(TenantModel, tenant_id) is None
+
+
+# ---------------------------------------------------------------------------
+# TenantMiddleware tests
+# ---------------------------------------------------------------------------
+class TestTenantMiddleware:
+    """Tests for the ASGI middleware that binds TenantContext."""
+
+    @staticmethod
+    async def _call(headers: list[tuple[bytes, bytes]]) -> dict[str, Any]:
+        """Run the middleware around a probe app and report what it saw."""
+        seen: dict[str, Any] = {}
+
+        async def probe_app(scope: Any, receive: Any, send: Any) -> None:
+            seen["state"] = scope.get("state", {})
+            try:
+                seen["tenant_id"] = TenantContext.get_current_tenant_id()
+            except AuthorizationError:
+                seen["tenant_id"] = None
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request"}
+
+        async def send(message: Any) -> None:
+            pass
+
+        scope = {"type": "http", "headers": headers}
+        await TenantMiddleware(probe_app)(scope, receive, send)
+        return seen
+
+    @pytest.mark.asyncio
+    async def test_sets_tenant_and_payload_from_bearer_token(self) -> None:
+        """A valid token should bind the tenant and stash the payload."""
+        tenant_id = str(uuid.uuid4())
+        token = JWTService(get_settings()).create_access_token(
+            user_id=str(uuid.uuid4()), tenant_id=tenant_id, role="member"
+        )
+        seen = await self._call([(b"authorization", f"Bearer {token}".encode())])
+
+        assert seen["tenant_id"] == tenant_id
+        assert seen["state"]["jwt_payload"]["tenant_id"] == tenant_id
+        # Context is cleared once the request completes
+        with pytest.raises(AuthorizationError):
+            TenantContext.get_current_tenant_id()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_passes_through(self) -> None:
+        """An invalid token should neither bind a tenant nor fail the call."""
+        seen = await self._call([(b"authorization", b"Bearer garbage")])
+        assert seen["tenant_id"] is None
+        assert "jwt_payload" not in seen["state"]
+
+
+# ---------------------------------------------------------------------------
+# RateLimitMiddleware tests
+# ---------------------------------------------------------------------------
+class _FakeRedis:
+    """In-memory stand-in for the sliding-window Lua script."""
+
+    def __init__(self) -> None:
+        self.windows: dict[str, list[int]] = {}
+
+    def register_script(self, script: str) -> Any:
+        async def run(keys: list[str], args: list[Any]) -> list[int]:
+            window_start, limit, now_ms = int(args[0]), int(args[1]), int(args[2])
+            hits = [t for t in self.windows.get(keys[0], []) if t > window_start]
+            self.windows[keys[0]] = hits
+            if len(hits) < limit:
+                hits.append(now_ms)
+                return [1, limit - len(hits), 0]
+            return [0, 0, hits[0] if hits else now_ms]
+
+        return run
+
+
+class TestRateLimitMiddleware:
+    """Tests for the Redis sliding-window rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_requests_over_the_limit(self) -> None:
+        """Requests beyond the limit should get 429 with Retry-After."""
+        messages: list[dict[str, Any]] = []
+
+        async def app(scope: Any, receive: Any, send: Any) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request"}
+
+        async def send(message: Any) -> None:
+            messages.append(message)
+
+        fake = _FakeRedis()
+        middleware = RateLimitMiddleware(
+            app,
+            redis=fake,  # type: ignore[arg-type]
+            limit=2,
+            window_seconds=60,
+            local_fraction=0,
+        )
+        scope = {
+            "type": "http",
+            "path": "/api/resumes/",
+            "headers": [],
+            "client": ("10.0.0.1", 1234),
+            "state": {"jwt_payload": {"tenant_id": "t1", "sub": "u1"}},
+        }
+        for _ in range(3):
+            await middleware(scope, receive, send)
+
+        statuses = [m["status"] for m in messages if m["type"] == "http.response.start"]
+        assert statuses == [200, 200, 429]
+        assert list(fake.windows) == ["rl:t1:u1:/api/resumes"]
+        headers = dict(messages[-2]["headers"])
+        assert int(headers[b"retry-after"]) >= 1
+
+    @staticmethod
+    async def _statuses(
+        limit: int, scope: dict[str, Any], requests: int
+    ) -> tuple[list[int], _FakeRedis]:
+        """Send ``requests`` calls through a limiter; return response codes."""
+        statuses: list[int] = []
+
+        async def app(scope: Any, receive: Any, send: Any) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request"}
+
+        async def send(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        fake = _FakeRedis()
+        middleware = RateLimitMiddleware(
+            app,
+            redis=fake,  # type: ignore[arg-type]
+            limit=limit,
+            window_seconds=60,
+            local_fraction=0,
+        )
+        for _ in range(requests):
+            await middleware(scope, receive, send)
+        return statuses, fake
+
+    @pytest.mark.asyncio
+    async def test_preflight_requests_are_not_counted(self) -> None:
+        """CORS preflight OPTIONS requests should bypass the limiter."""
+        scope = {
+            "type": "http",
+            "method": "OPTIONS",
+            "path": "/api/resumes/",
+            "headers": [],
+            "client": ("10.0.0.1", 1234),
+        }
+        statuses, fake = await self._statuses(limit=1, scope=scope, requests=3)
+        assert statuses == [200, 200, 200]
+        assert fake.windows == {}
+
+    @pytest.mark.asyncio
+    async def test_explicit_zero_limit_rejects_everything(self) -> None:
+        """limit=0 should mean zero requests, not the configured default."""
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/resumes/",
+            "headers": [],
+            "client": ("10.0.0.1", 1234),
+        }
+        statuses, _ = await self._statuses(limit=0, scope=scope, requests=1)
+        assert statuses == [429]
+
+    def test_cors_wraps_the_rate_limiter(self) -> None:
+        """CORS must be outermost so 429 responses carry its headers."""
+        # user_middleware is ordered outermost first
+        assert cast(Any, app.user_middleware[0].cls) is CORSMiddleware
+
+    def test_local_bucket_absorbs_burst_before_redis(self) -> None:
+        """The in-process bucket should serve its share, then defer."""
+
+        async def app(scope: Any, receive: Any, send: Any) -> None:
+            pass
+
+        middleware = RateLimitMiddleware(
+            app,
+            redis=_FakeRedis(),  # type: ignore[arg-type]
+            limit=20,
+            window_seconds=60,
+            local_fraction=0.1,
+        )
+        taken = [middleware._take_local("k") for _ in range(3)]
+        assert taken == [True, True, False]
+
+
 # ---------------------------------------------------------------------------
 # InProcessEventBus tests
 # ---------------------------------------------------------------------------
@@ -147,8 +383,6 @@ class TestInProcessEventBus:
     @pytest.mark.asyncio
     async def test_subscribe_and_publish_delivers_event(self) -> None:
         """A subscribed handler should receive the published event."""
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         received: list[DomainEvent] = []
 
@@ -167,8 +401,6 @@ class TestInProcessEventBus:
     @pytest.mark.asyncio
     async def test_multiple_handlers_all_receive_event(self) -> None:
         """All handlers for the same event type should be invoked."""
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         calls: list[str] = []
 
@@ -188,8 +420,6 @@ class TestInProcessEventBus:
     @pytest.mark.asyncio
     async def test_handler_exception_does_not_block_others(self) -> None:
         """A failing handler must not prevent other handlers from running."""
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         calls: list[str] = []
 
@@ -206,19 +436,61 @@ class TestInProcessEventBus:
 
         assert calls == ["ok"]
 
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently(self) -> None:
+        """Handlers should overlap rather than run one after another."""
+        bus = InProcessEventBus()
+        b_started = asyncio.Event()
+
+        # handler_a can only finish once handler_b has started, which
+        # never happens if publish awaits the handlers sequentially.
+        async def handler_a(event: DomainEvent) -> None:
+            await b_started.wait()
+
+        async def handler_b(event: DomainEvent) -> None:
+            b_started.set()
+
+        bus.subscribe("TestEvent", handler_a)
+        bus.subscribe("TestEvent", handler_b)
+
+        await asyncio.wait_for(bus.publish(DomainEvent(event_type="TestEvent")), 1.0)
+
+        assert b_started.is_set()
+
+    @pytest.mark.asyncio
+    async def test_handler_subscribing_during_publish(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A handler added mid-dispatch only receives later events."""
+        bus = InProcessEventBus()
+        calls: list[str] = []
+
+        async def late_handler(event: DomainEvent) -> None:
+            calls.append("late")
+
+        async def subscribing_handler(event: DomainEvent) -> None:
+            bus.subscribe("TestEvent", late_handler)
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        bus.subscribe("TestEvent", subscribing_handler)
+
+        await bus.publish(DomainEvent(event_type="TestEvent"))
+        assert calls == []
+        assert "subscribing_handler failed" in caplog.text
+
+        await bus.publish(DomainEvent(event_type="TestEvent"))
+        assert calls == ["late"]
+
     @pytest.mark.asyncio
     async def test_unsubscribed_event_type_is_silently_ignored(self) -> None:
         """Publishing an event with no subscribers should not raise."""
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         await bus.publish(DomainEvent(event_type="NobodyListens"))
 
     @pytest.mark.asyncio
     async def test_different_event_types_are_isolated(self) -> None:
         """Handlers for one event type must not receive other types."""
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         received: list[str] = []
 
@@ -235,8 +507,5 @@ class TestInProcessEventBus:
 
     def test_implements_ieventbus_interface(self) -> None:
         """InProcessEventBus should be an instance of IEventBus."""
-        from shared.domain.domain_event import IEventBus
-        from shared.infrastructure.event_bus_impl import InProcessEventBus
-
         bus = InProcessEventBus()
         assert isinstance(bus, IEventBus)